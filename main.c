@@ -15,7 +15,7 @@
 int main(int argc, char **argv) {
     printf("[main:%d] Starting RSA-4096 application\n", __LINE__);
     if (argc < 2) {
-        printf("Usage: %s [verify|test|benchmark|binary]\n", argv[0]);
+        printf("Usage: %s [verify|test|benchmark|binary|division|inverse|montgomery]\n", argv[0]);
         return 1;
     }
     if (strcmp(argv[1], "verify") == 0) {
@@ -34,6 +34,18 @@ int main(int argc, char **argv) {
         printf("[main:%d] Running binary operations verification\n", __LINE__);
         return run_binary_verification();
     }
+    if (strcmp(argv[1], "division") == 0) {
+        printf("[main:%d] Running division and Barrett reduction tests\n", __LINE__);
+        return test_division_consistency();
+    }
+    if (strcmp(argv[1], "inverse") == 0) {
+        printf("[main:%d] Running modular inverse tests\n", __LINE__);
+        return test_mod_inverse_consistency();
+    }
+    if (strcmp(argv[1], "montgomery") == 0) {
+        printf("[main:%d] Running Montgomery consistency tests\n", __LINE__);
+        return test_montgomery_consistency();
+    }
     printf("Unknown command: %s\n", argv[1]);
     return 1;
 }
\ No newline at end of file
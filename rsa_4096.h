@@ -59,7 +59,7 @@
  * @brief Big integer representation
  */
 typedef struct {
-    uint32_t words[BIGINT_4096_WORDS];  /* Little-endian word array */
+    uint32_t words[BIGINT_4096_WORDS];  /* Little-endian word array (valid below used) */
     int used;                           /* Number of significant words */
     int sign;                          /* 0 = positive, 1 = negative */
 } bigint_t;
@@ -71,13 +71,23 @@ typedef struct {
     bigint_t n;          /* Modulus (must be odd) */
     bigint_t r;          /* R = 2^(32 * n_words) where R > n */
     bigint_t r_squared;  /* R^2 mod n for conversion to Montgomery form */
-    bigint_t r_inv;      /* R^(-1) mod n for conversion from Montgomery form */
+    bigint_t r_mod_n;    /* R mod n, i.e. 1 in Montgomery form */
     uint32_t n_prime;    /* -n^(-1) mod 2^32 for REDC algorithm */
     int n_words;         /* Number of words in modulus */
     int r_words;         /* Number of words in R */
     int is_active;       /* 1 if Montgomery is active, 0 if disabled */
 } montgomery_ctx_t;
 
+/**
+ * @brief Barrett reduction context for a fixed modulus
+ */
+typedef struct {
+    bigint_t n;          /* Modulus */
+    bigint_t mu;         /* floor(2^(64 * k) / n), precomputed once */
+    int k;               /* Number of words in modulus */
+    int is_active;       /* 1 if Barrett is active, 0 to fall back to bigint_mod */
+} barrett_ctx_t;
+
 /**
  * @brief RSA key structure
  */
@@ -88,6 +98,19 @@ typedef struct {
     int is_private;               /* 0 = public key, 1 = private key */
 } rsa_4096_key_t;
 
+/**
+ * @brief RSA private key in CRT form
+ */
+typedef struct {
+    bigint_t p;                   /* First prime factor */
+    bigint_t q;                   /* Second prime factor */
+    bigint_t dp;                  /* d mod (p - 1) */
+    bigint_t dq;                  /* d mod (q - 1) */
+    bigint_t q_inv;               /* q^(-1) mod p */
+    montgomery_ctx_t mont_p;      /* Montgomery REDC context mod p */
+    montgomery_ctx_t mont_q;      /* Montgomery REDC context mod q */
+} rsa_4096_crt_key_t;
+
 /* ===================== DEBUG UTILITIES ===================== */
 
 void debug_print_bigint(const char *name, const bigint_t *a);
@@ -130,6 +153,9 @@ int bigint_add_word(bigint_t *result, const bigint_t *a, uint32_t word);
 
 /* Modular arithmetic - FIXED */
 int bigint_mod_exp(bigint_t *result, const bigint_t *base, const bigint_t *exp, const bigint_t *mod);
+int bigint_fermat_exponent_shift(const bigint_t *exp);
+int barrett_ctx_init(barrett_ctx_t *ctx, const bigint_t *modulus);
+int barrett_reduce(bigint_t *result, const bigint_t *x, const barrett_ctx_t *ctx);
 int mod_inverse_extended_gcd(bigint_t *result, const bigint_t *a, const bigint_t *m);
 
 /* ===================== MONTGOMERY REDC OPERATIONS - FIXED ===================== */
@@ -170,12 +196,22 @@ int rsa_4096_decrypt_binary(const rsa_4096_key_t *priv_key, const uint8_t *encry
                            size_t encrypted_size, uint8_t *message, size_t message_buffer_size,
                            size_t *message_size);
 
+/* CRT decryption */
+int rsa_4096_load_crt_key(rsa_4096_crt_key_t *key, const char *p_decimal, const char *q_decimal,
+                          const char *d_decimal);
+void rsa_4096_crt_free(rsa_4096_crt_key_t *key);
+int rsa_4096_decrypt_crt(const rsa_4096_crt_key_t *crt_key, const char *encrypted_hex,
+                        char *message_decimal, size_t message_size);
+
 /* ===================== TESTING FUNCTIONS ===================== */
 
 int run_verification(void);
 int run_binary_verification(void);
 int run_benchmarks(void);
 int test_large_rsa_keys(void);
+int test_division_consistency(void);
+int test_mod_inverse_consistency(void);
+int test_montgomery_consistency(void);
 
 /* ===================== HELPER FUNCTIONS - FIXED ===================== */
 
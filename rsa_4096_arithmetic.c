@@ -14,8 +14,167 @@
 #include <inttypes.h>
 #include "rsa_4096.h"
 
+#ifdef RSA_4096_USE_GMP
+#include <gmp.h>
+#endif
+
+/* ===================== OPTIONAL GMP BACKEND ===================== */
+
+#ifdef RSA_4096_USE_GMP
+/**
+ * @brief Load a bigint into an initialized mpz (little-endian 32-bit words)
+ */
+static void bigint_to_mpz(mpz_t z, const bigint_t *a) {
+    mpz_import(z, (size_t)a->used, -1, sizeof(uint32_t), 0, 0, a->words);
+}
+
+/**
+ * @brief Store an mpz back into a bigint
+ */
+static int bigint_from_mpz(bigint_t *a, const mpz_t z) {
+    size_t count = (mpz_sizeinbase(z, 2) + 31) / 32;
+    if (count > BIGINT_4096_WORDS) {
+        return -2; /* Overflow */
+    }
+    
+    bigint_init(a);
+    mpz_export(a->words, &count, -1, sizeof(uint32_t), 0, 0, z);
+    a->used = (int)count;
+    bigint_normalize(a);
+    return 0;
+}
+#endif
+
+/* ===================== BARRETT REDUCTION ===================== */
+
+/**
+ * @brief Precompute mu = floor(2^(64 * k) / n) for a k-word modulus
+ *
+ * Barrett is left inactive (callers fall back to bigint_mod) when the
+ * intermediate products would not fit in a bigint_t.
+ */
+int barrett_ctx_init(barrett_ctx_t *ctx, const bigint_t *modulus) {
+    if (ctx == NULL || modulus == NULL) {
+        ERROR_RETURN(-1, "NULL pointer in barrett_ctx_init");
+    }
+    
+    if (bigint_is_zero(modulus)) {
+        ERROR_RETURN(-2, "Modulus cannot be zero");
+    }
+    
+    memset(ctx, 0, sizeof(barrett_ctx_t));
+    bigint_copy(&ctx->n, modulus);
+    ctx->k = modulus->used;
+    
+    /* q1 * mu has up to 2k + 2 words */
+    if (2 * ctx->k + 2 > BIGINT_4096_WORDS) {
+        return 0;
+    }
+    
+    bigint_t b_2k, rem;
+    bigint_init(&b_2k);
+    memset(b_2k.words, 0, (size_t)(2 * ctx->k) * sizeof(uint32_t));
+    b_2k.words[2 * ctx->k] = 1;
+    b_2k.used = 2 * ctx->k + 1;
+    
+    int ret = bigint_div(&ctx->mu, &rem, &b_2k, modulus);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to compute Barrett mu");
+    }
+    
+    ctx->is_active = 1;
+    return 0;
+}
+
+/**
+ * @brief result = x mod n using the cached mu (HAC 14.42)
+ */
+int barrett_reduce(bigint_t *result, const bigint_t *x, const barrett_ctx_t *ctx) {
+    if (result == NULL || x == NULL || ctx == NULL) {
+        return -1;
+    }
+    
+    /* Barrett needs x < 2^(64 * k) */
+    if (!ctx->is_active || x->used > 2 * ctx->k) {
+        return bigint_mod(result, x, &ctx->n);
+    }
+    
+    if (bigint_compare(x, &ctx->n) < 0) {
+        bigint_copy(result, x);
+        return 0;
+    }
+    
+    /* q3 = floor(floor(x / b^(k-1)) * mu / b^(k+1)), at most 2 below floor(x / n) */
+    bigint_t q, temp, r;
+    int ret = bigint_shift_right(&q, x, 32 * (ctx->k - 1));
+    if (ret != 0) return ret;
+    
+    ret = bigint_mul(&temp, &q, &ctx->mu);
+    if (ret != 0) return ret;
+    
+    ret = bigint_shift_right(&q, &temp, 32 * (ctx->k + 1));
+    if (ret != 0) return ret;
+    
+    /* r = x - q3 * n, then at most two corrective subtractions */
+    ret = bigint_mul(&temp, &q, &ctx->n);
+    if (ret != 0) return ret;
+    
+    ret = bigint_sub(&r, x, &temp);
+    if (ret != 0) return ret;
+    
+    while (bigint_compare(&r, &ctx->n) >= 0) {
+        ret = bigint_sub(&temp, &r, &ctx->n);
+        if (ret != 0) return ret;
+        bigint_copy(&r, &temp);
+    }
+    
+    bigint_copy(result, &r);
+    return 0;
+}
+
 /* ===================== FIXED MODULAR EXPONENTIATION ===================== */
 
+/**
+ * @brief Return k if exp == 2^k + 1 with k >= 1 (e.g. 65537 gives 16), otherwise 0
+ */
+int bigint_fermat_exponent_shift(const bigint_t *exp) {
+    int k = bigint_bit_length(exp) - 1;
+    if (k < 1) {
+        return 0;
+    }
+    
+    for (int i = 0; i < exp->used; i++) {
+        uint32_t expected = (i == 0 ? 1U : 0U) | (i == k / 32 ? 1U << (k % 32) : 0U);
+        if (exp->words[i] != expected) {
+            return 0;
+        }
+    }
+    
+    return k;
+}
+
+/**
+ * @brief base^exp mod m for a single-word modulus using native 64-bit arithmetic
+ */
+static uint32_t mod_exp_word(const bigint_t *base, const bigint_t *exp, uint32_t m) {
+    /* Reduce the base one word at a time (Horner) */
+    uint64_t b = 0;
+    for (int i = base->used - 1; i >= 0; i--) {
+        b = ((b << 32) | base->words[i]) % m;
+    }
+    
+    /* Left-to-right square-and-multiply; every product fits in 64 bits */
+    uint64_t r = 1 % m;
+    for (int i = bigint_bit_length(exp) - 1; i >= 0; i--) {
+        r = (r * r) % m;
+        if (bigint_get_bit(exp, i)) {
+            r = (r * b) % m;
+        }
+    }
+    
+    return (uint32_t)r;
+}
+
 int bigint_mod_exp(bigint_t *result, const bigint_t *base, const bigint_t *exp, const bigint_t *mod) {
     if (result == NULL || base == NULL || exp == NULL || mod == NULL) {
         return -1;
@@ -38,6 +197,58 @@ int bigint_mod_exp(bigint_t *result, const bigint_t *base, const bigint_t *exp,
     printf("[MOD_EXP_COMPLETE] Computing %d-word^%d-word mod %d-word\n", 
            base->used, exp->used, mod->used);
     
+#ifdef RSA_4096_USE_GMP
+    /* GMP fast path: convert once at the boundary and let mpz_powm do the work */
+    {
+        mpz_t z_base, z_exp, z_mod;
+        mpz_init(z_base);
+        mpz_init(z_exp);
+        mpz_init(z_mod);
+        bigint_to_mpz(z_base, base);
+        bigint_to_mpz(z_exp, exp);
+        bigint_to_mpz(z_mod, mod);
+        
+        mpz_powm(z_base, z_base, z_exp, z_mod);
+        int ret = bigint_from_mpz(result, z_base);
+        
+        mpz_clear(z_base);
+        mpz_clear(z_exp);
+        mpz_clear(z_mod);
+        return ret;
+    }
+#endif
+    
+    /* Single-word modulus: no bigint temporaries needed */
+    if (mod->used == 1) {
+        bigint_set_u32(result, mod_exp_word(base, exp, mod->words[0]));
+        return 0;
+    }
+    
+    /* Precompute the Barrett constant once; every reduction below reuses it */
+    barrett_ctx_t barrett;
+    int barrett_ret = barrett_ctx_init(&barrett, mod);
+    if (barrett_ret != 0) return barrett_ret;
+    
+    /* e = 2^k + 1 (65537 and friends): k squarings and one multiply, no per-bit dispatch */
+    int fermat_k = bigint_fermat_exponent_shift(exp);
+    if (fermat_k > 0) {
+        bigint_t reduced_base, acc, product;
+        int ret = barrett_reduce(&reduced_base, base, &barrett);
+        if (ret != 0) return ret;
+        
+        bigint_copy(&acc, &reduced_base);
+        for (int i = 0; i < fermat_k; i++) {
+            ret = bigint_mul(&product, &acc, &acc);
+            if (ret != 0) return ret;
+            ret = barrett_reduce(&acc, &product, &barrett);
+            if (ret != 0) return ret;
+        }
+        
+        ret = bigint_mul(&product, &acc, &reduced_base);
+        if (ret != 0) return ret;
+        return barrett_reduce(result, &product, &barrett);
+    }
+    
     /* Optimized exponentiation with sliding window for large exponents */
     if (exp->used > 20) {
         printf("[MOD_EXP_COMPLETE] Very large exponent (%d words), using 4-bit sliding window\n", exp->used);
@@ -47,7 +258,7 @@ int bigint_mod_exp(bigint_t *result, const bigint_t *base, const bigint_t *exp,
         bigint_set_u32(&temp_result, 1);
         
         /* Reduce base mod modulus first */
-        int ret = bigint_mod(&temp_base, base, mod);
+        int ret = barrett_reduce(&temp_base, base, &barrett);
         if (ret != 0) return ret;
         
         /* Precompute powers: base^0, base^1, ..., base^15 */
@@ -58,7 +269,7 @@ int bigint_mod_exp(bigint_t *result, const bigint_t *base, const bigint_t *exp,
             bigint_t temp_mult;
             ret = bigint_mul(&temp_mult, &window_powers[i-1], &temp_base);
             if (ret != 0) return ret;
-            ret = bigint_mod(&window_powers[i], &temp_mult, mod);
+            ret = barrett_reduce(&window_powers[i], &temp_mult, &barrett);
             if (ret != 0) return ret;
         }
         
@@ -75,9 +286,7 @@ int bigint_mod_exp(bigint_t *result, const bigint_t *base, const bigint_t *exp,
             int window = 0;
             int actual_bits = 0;
             for (int j = 0; j < 4 && bit_pos - j >= 0; j++) {
-                if (bigint_get_bit(exp, bit_pos - j)) {
-                    window |= (1 << (3 - j));
-                }
+                window = (window << 1) | bigint_get_bit(exp, bit_pos - j);
                 actual_bits++;
             }
             
@@ -96,7 +305,7 @@ int bigint_mod_exp(bigint_t *result, const bigint_t *base, const bigint_t *exp,
                     bigint_t temp_square;
                     ret = bigint_mul(&temp_square, &temp_result, &temp_result);
                     if (ret != 0) return ret;
-                    ret = bigint_mod(&temp_result, &temp_square, mod);
+                    ret = barrett_reduce(&temp_result, &temp_square, &barrett);
                     if (ret != 0) return ret;
                 }
                 
@@ -105,7 +314,7 @@ int bigint_mod_exp(bigint_t *result, const bigint_t *base, const bigint_t *exp,
                     bigint_t temp_mult;
                     ret = bigint_mul(&temp_mult, &temp_result, &window_powers[window]);
                     if (ret != 0) return ret;
-                    ret = bigint_mod(&temp_result, &temp_mult, mod);
+                    ret = barrett_reduce(&temp_result, &temp_mult, &barrett);
                     if (ret != 0) return ret;
                 }
             }
@@ -123,74 +332,48 @@ int bigint_mod_exp(bigint_t *result, const bigint_t *base, const bigint_t *exp,
     }
     
     /* Standard right-to-left binary method for smaller exponents */
-    bigint_t temp_result, temp_base, temp_exp;
+    bigint_t temp_result, temp_base, product;
     bigint_set_u32(&temp_result, 1);
-    bigint_init(&temp_base);
-    bigint_init(&temp_exp);
     
     /* Reduce base mod modulus first */
-    int ret = bigint_mod(&temp_base, base, mod);
+    int ret = barrett_reduce(&temp_base, base, &barrett);
     if (ret != 0) return ret;
     
-    /* Copy exponent for processing */
-    bigint_copy(&temp_exp, exp);
+    /* Walk the exponent bits in place instead of shifting a copy */
+    int exp_bits = bigint_bit_length(exp);
     
     printf("[MOD_EXP_COMPLETE] Starting right-to-left binary method\n");
     printf("[MOD_EXP_COMPLETE] Base: %d words, Exp: %d words, Mod: %d words\n", 
-           temp_base.used, temp_exp.used, mod->used);
+           temp_base.used, exp->used, mod->used);
     
-    int bit_count = 0;
-    while (!bigint_is_zero(&temp_exp)) {
+    int bit_count;
+    for (bit_count = 0; bit_count < exp_bits; bit_count++) {
         /* Check if current bit is 1 */
-        if (temp_exp.words[0] & 1) {
+        if (bigint_get_bit(exp, bit_count)) {
             if (bit_count < 10 || bit_count % 50 == 0) {
                 printf("[MOD_EXP_COMPLETE] Bit %d is 1, multiplying result by base\n", bit_count);
             }
             
-            bigint_t new_result, product;
-            bigint_init(&new_result);
-            bigint_init(&product);
             ret = bigint_mul(&product, &temp_result, &temp_base);
             if (ret != 0) return ret;
             
-            ret = bigint_mod(&new_result, &product, mod);
+            /* barrett_reduce writes its result last, so it can reduce in place */
+            ret = barrett_reduce(&temp_result, &product, &barrett);
             if (ret != 0) return ret;
-            
-            bigint_copy(&temp_result, &new_result);
         }
         
-        /* Right shift exponent by 1 bit - FIXED */
-        bigint_t new_exp;
-        bigint_init(&new_exp);
-        ret = bigint_shift_right(&new_exp, &temp_exp, 1);
-        if (ret != 0) return ret;
-        bigint_copy(&temp_exp, &new_exp);
-        
-        /* Square the base for next iteration - FIXED: Only if exponent is not zero */
-        if (!bigint_is_zero(&temp_exp)) {
-            bigint_t new_base, square;
-            bigint_init(&new_base);
-            bigint_init(&square);
-            ret = bigint_mul(&square, &temp_base, &temp_base);
+        /* Square the base for next iteration - only if bits remain */
+        if (bit_count < exp_bits - 1) {
+            ret = bigint_mul(&product, &temp_base, &temp_base);
             if (ret != 0) return ret;
             
-            ret = bigint_mod(&new_base, &square, mod);
+            ret = barrett_reduce(&temp_base, &product, &barrett);
             if (ret != 0) return ret;
-            
-            bigint_copy(&temp_base, &new_base);
         }
         
-        bit_count++;
-        
         /* Progress reporting for large computations */
-        if (bit_count % 100 == 0) {
-            printf("[MOD_EXP_COMPLETE] Progress: bit %d processed\n", bit_count);
-        }
-        
-        /* Safety check */
-        if (bit_count > 50000) {
-            printf("[MOD_EXP_COMPLETE] ERROR: Too many iterations, aborting\n");
-            return -3;
+        if ((bit_count + 1) % 100 == 0) {
+            printf("[MOD_EXP_COMPLETE] Progress: bit %d processed\n", bit_count + 1);
         }
     }
     
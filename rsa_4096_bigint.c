@@ -15,17 +15,23 @@
 
 /* ===================== BASIC BIGINT OPERATIONS ===================== */
 
+/*
+ * Only words[0 .. used-1] are significant; words above `used` are left
+ * unspecified so that temporaries cost O(used) rather than O(capacity).
+ * Routines that accumulate into their output clear the range they touch.
+ */
 void bigint_init(bigint_t *a) {
     if (a) {
-        memset(a->words, 0, sizeof(a->words));
+        a->words[0] = 0;
         a->used = 0;
         a->sign = 0;
     }
 }
 
 void bigint_copy(bigint_t *dst, const bigint_t *src) {
-    if (dst && src) {
-        memcpy(dst->words, src->words, sizeof(src->words));
+    if (dst && src && dst != src) {
+        int count = (src->used > 0) ? src->used : 1;
+        memcpy(dst->words, src->words, (size_t)count * sizeof(uint32_t));
         dst->used = src->used;
         dst->sign = src->sign;
     }
@@ -95,28 +101,55 @@ int bigint_ensure_capacity(bigint_t *a, int min_words) {
 
 /* ===================== STRING/BINARY CONVERSIONS - BUGS FIXED ===================== */
 
+/* Largest power of ten that fits in a word: decimal digits are processed 9 at a time */
+#define DECIMAL_CHUNK_DIGITS 9
+#define DECIMAL_CHUNK_BASE 1000000000U
+
+/**
+ * @brief a = a * mul + add in place
+ */
+static int bigint_mul_add_small(bigint_t *a, uint32_t mul, uint32_t add) {
+    uint64_t carry = add;
+    for (int i = 0; i < a->used; i++) {
+        uint64_t cur = (uint64_t)a->words[i] * mul + carry;
+        a->words[i] = (uint32_t)cur;
+        carry = cur >> 32;
+    }
+    
+    if (carry != 0) {
+        if (a->used >= BIGINT_4096_WORDS) {
+            return -2; /* Overflow */
+        }
+        a->words[a->used++] = (uint32_t)carry;
+    }
+    
+    return 0;
+}
+
 int bigint_from_decimal(bigint_t *a, const char *decimal) {
     bigint_init(a);
     if (!decimal || !*decimal) return 0;
     
-    size_t len = strlen(decimal);
-    bigint_t ten;
-    bigint_set_u32(&ten, 10);
+    uint32_t chunk = 0;
+    uint32_t chunk_scale = 1;
     
-    for (size_t i = 0; i < len; ++i) {
-        if (decimal[i] < '0' || decimal[i] > '9') continue;
-        
-        uint32_t digit = decimal[i] - '0';
-        
-        /* a = a * 10 + digit */
-        bigint_t temp;
-        int ret = bigint_mul(&temp, a, &ten);
-        if (ret != 0) return ret;
+    for (const char *c = decimal; *c; ++c) {
+        if (*c < '0' || *c > '9') continue;
         
-        bigint_t digit_bigint;
-        bigint_set_u32(&digit_bigint, digit);
+        chunk = chunk * 10 + (uint32_t)(*c - '0');
+        chunk_scale *= 10;
         
-        ret = bigint_add(a, &temp, &digit_bigint);
+        /* a = a * 10^9 + chunk once a full chunk is collected */
+        if (chunk_scale == DECIMAL_CHUNK_BASE) {
+            int ret = bigint_mul_add_small(a, chunk_scale, chunk);
+            if (ret != 0) return ret;
+            chunk = 0;
+            chunk_scale = 1;
+        }
+    }
+    
+    if (chunk_scale > 1) {
+        int ret = bigint_mul_add_small(a, chunk_scale, chunk);
         if (ret != 0) return ret;
     }
     
@@ -130,21 +163,30 @@ int bigint_to_decimal(const bigint_t *a, char *str, size_t str_size) {
         return 0;
     }
     
-    bigint_t x;
-    bigint_copy(&x, a);
+    uint32_t x[BIGINT_4096_WORDS];
+    int used = a->used;
+    memcpy(x, a->words, (size_t)used * sizeof(uint32_t));
     char buf[2048];
     size_t p = 0; /* FIXED: Use size_t for proper comparison */
     
-    bigint_t ten;
-    bigint_set_u32(&ten, 10);
-    
-    while (!bigint_is_zero(&x)) {
-        bigint_t q, r;
-        int ret = bigint_div(&q, &r, &x, &ten);
-        if (ret != 0) return ret;
+    /* Short division by 10^9 in place; each remainder gives 9 digits, least significant first */
+    while (used > 0) {
+        uint64_t rem = 0;
+        for (int i = used - 1; i >= 0; i--) {
+            uint64_t cur = (rem << 32) | x[i];
+            x[i] = (uint32_t)(cur / DECIMAL_CHUNK_BASE);
+            rem = cur % DECIMAL_CHUNK_BASE;
+        }
+        while (used > 0 && x[used - 1] == 0) {
+            used--;
+        }
         
-        buf[p++] = '0' + (r.used ? r.words[0] : 0);
-        bigint_copy(&x, &q);
+        /* Emit the chunk, dropping zero padding on the most significant one */
+        for (int d = 0; d < DECIMAL_CHUNK_DIGITS && (used > 0 || rem != 0); d++) {
+            buf[p++] = (char)('0' + rem % 10);
+            rem /= 10;
+            if (p >= sizeof(buf) - 1) break;
+        }
         
         if (p >= sizeof(buf) - 1) break;
     }
@@ -161,28 +203,30 @@ int bigint_from_hex(bigint_t *a, const char *hex) {
     bigint_init(a);
     if (!hex || !*hex) return 0;
     
+    /* Pack nibbles straight into words, starting from the least significant digit */
     size_t len = strlen(hex);
-    bigint_t sixteen;
-    bigint_set_u32(&sixteen, 16);
+    int nibble = 0;
     
-    for (size_t i = 0; i < len; ++i) {
-        char c = hex[i];
+    for (size_t i = len; i > 0; --i) {
+        char c = hex[i - 1];
         uint32_t digit = 0;
         if (c >= '0' && c <= '9') digit = c - '0';
         else if (c >= 'a' && c <= 'f') digit = c - 'a' + 10;
         else if (c >= 'A' && c <= 'F') digit = c - 'A' + 10;
         else continue;
         
-        /* a = a * 16 + digit */
-        bigint_t temp;
-        int ret = bigint_mul(&temp, a, &sixteen);
-        if (ret != 0) return ret;
-        
-        bigint_t digit_bigint;
-        bigint_set_u32(&digit_bigint, digit);
+        int word_idx = nibble / 8;
+        if (word_idx >= BIGINT_4096_WORDS) {
+            if (digit != 0) return -2; /* Overflow */
+            continue;
+        }
         
-        ret = bigint_add(a, &temp, &digit_bigint);
-        if (ret != 0) return ret;
+        if (nibble % 8 == 0) {
+            a->words[word_idx] = 0;
+            a->used = word_idx + 1;
+        }
+        a->words[word_idx] |= digit << (4 * (nibble % 8));
+        nibble++;
     }
     
     bigint_normalize(a);
@@ -195,30 +239,20 @@ int bigint_to_hex(const bigint_t *a, char *hex, size_t hex_size) {
         return 0;
     }
     
-    bigint_t x;
-    bigint_copy(&x, a);
-    char buf[2048];
-    size_t p = 0; /* FIXED: Use size_t for proper comparison */
-    
-    bigint_t sixteen;
-    bigint_set_u32(&sixteen, 16);
-    
-    while (!bigint_is_zero(&x)) {
-        bigint_t q, r;
-        int ret = bigint_div(&q, &r, &x, &sixteen);
-        if (ret != 0) return ret;
-        
-        uint32_t v = r.used ? r.words[0] : 0;
-        buf[p++] = (v < 10) ? ('0' + v) : ('a' + v - 10);
-        bigint_copy(&x, &q);
-        
-        if (p >= sizeof(buf) - 1) break;
+    static const char digits[] = "0123456789abcdef";
+    size_t i = 0;
+    int started = 0;
+    
+    /* Read nibbles from the most significant word down, skipping leading zeros */
+    for (int w = a->used - 1; w >= 0; w--) {
+        for (int shift = 28; shift >= 0; shift -= 4) {
+            uint32_t v = (a->words[w] >> shift) & 0xF;
+            if (!started && v == 0) continue;
+            started = 1;
+            if (i < hex_size - 1) hex[i++] = digits[v];
+        }
     }
     
-    size_t i = 0;
-    /* FIXED: Proper size_t comparison */
-    for (size_t pi = p; pi > 0 && i < hex_size - 1; pi--, i++)
-        hex[i] = buf[pi - 1];
     hex[i] = 0;
     return 0;
 }
@@ -233,6 +267,8 @@ int bigint_from_binary(bigint_t *a, const uint8_t *data, size_t data_size) {
         return -1; /* Too large */
     }
     
+    memset(a->words, 0, (size_t)words_needed * sizeof(uint32_t));
+    
     /* Convert from big-endian bytes to little-endian words */
     for (size_t i = 0; i < data_size; i++) {
         int word_idx = (data_size - 1 - i) / 4;
@@ -297,6 +333,8 @@ int bigint_shift_left(bigint_t *r, const bigint_t *a, int bits) {
         return -3; /* Overflow */
     }
     
+    memset(r->words, 0, (size_t)(a->used + word_shift + (bit_shift ? 1 : 0)) * sizeof(uint32_t));
+    
     /* Perform the shift */
     for (int i = a->used - 1; i >= 0; i--) {
         uint64_t val = (uint64_t)a->words[i];
@@ -386,6 +424,12 @@ int bigint_bit_length(const bigint_t *a) {
     int word_idx = a->used - 1;
     uint32_t top_word = a->words[word_idx];
     
+#if defined(__GNUC__)
+    if (top_word != 0) {
+        return word_idx * 32 + 32 - __builtin_clz(top_word);
+    }
+#endif
+    
     int bit_pos = 31;
     while (bit_pos > 0 && !(top_word & (1U << bit_pos))) {
         bit_pos--;
@@ -459,6 +503,8 @@ int bigint_mul(bigint_t *r, const bigint_t *a, const bigint_t *b) {
         return -2; /* Result would be too large */
     }
     
+    memset(r->words, 0, (size_t)(a->used + b->used) * sizeof(uint32_t));
+    
     for (int i = 0; i < a->used; i++) {
         uint64_t carry = 0;
         
@@ -494,48 +540,111 @@ int bigint_div(bigint_t *q, bigint_t *r, const bigint_t *a, const bigint_t *b) {
     
     if (bigint_is_zero(b)) return -2; /* Division by zero */
     
-    bigint_init(q);
-    bigint_init(r);
-    
     if (bigint_is_zero(a)) {
+        bigint_init(q);
+        bigint_init(r);
         return 0; /* 0 / x = 0 remainder 0 */
     }
     
     if (bigint_compare(a, b) < 0) {
         /* a < b, so quotient = 0, remainder = a */
         bigint_copy(r, a);
+        bigint_init(q);
         return 0;
     }
     
-    /* Simple subtraction-based division - guaranteed to work correctly */
-    bigint_t temp_dividend, temp_divisor;
-    bigint_init(&temp_dividend);
-    bigint_init(&temp_divisor);
-    bigint_copy(&temp_dividend, a);
-    bigint_copy(&temp_divisor, b);
+    /* Schoolbook long division (Knuth, TAOCP vol. 2, Algorithm D) on 32-bit digits */
+    const int m = a->used;
+    const int n = b->used;
+    uint32_t quot[BIGINT_4096_WORDS];
+    uint32_t un[BIGINT_4096_WORDS + 1];
+    uint32_t vn[BIGINT_4096_WORDS];
     
-    /* Count how many times we can subtract b from a */
-    uint32_t quotient_count = 0;
+    memset(quot, 0, sizeof(quot));
     
-    while (bigint_compare(&temp_dividend, &temp_divisor) >= 0) {
-        /* temp_dividend >= temp_divisor, so we can subtract */
-        bigint_t temp_result;
-        bigint_init(&temp_result);
-        int ret = bigint_sub(&temp_result, &temp_dividend, &temp_divisor);
-        if (ret != 0) return ret;
+    if (n == 1) {
+        /* Single-word divisor: short division */
+        uint64_t rem = 0;
+        for (int i = m - 1; i >= 0; i--) {
+            uint64_t cur = (rem << 32) | a->words[i];
+            quot[i] = (uint32_t)(cur / b->words[0]);
+            rem = cur % b->words[0];
+        }
         
-        bigint_copy(&temp_dividend, &temp_result);
-        quotient_count++;
+        q->used = m;
+        q->sign = 0;
+        memcpy(q->words, quot, (size_t)m * sizeof(uint32_t));
+        bigint_normalize(q);
+        bigint_set_u32(r, (uint32_t)rem);
+        return 0;
+    }
+    
+    /* D1: normalize so the divisor's top bit is set */
+    int s = 32 * n - bigint_bit_length(b);
+    for (int i = n - 1; i > 0; i--) {
+        vn[i] = (b->words[i] << s) | (s ? b->words[i - 1] >> (32 - s) : 0);
+    }
+    vn[0] = b->words[0] << s;
+    
+    un[m] = s ? a->words[m - 1] >> (32 - s) : 0;
+    for (int i = m - 1; i > 0; i--) {
+        un[i] = (a->words[i] << s) | (s ? a->words[i - 1] >> (32 - s) : 0);
+    }
+    un[0] = a->words[0] << s;
+    
+    for (int j = m - n; j >= 0; j--) {
+        /* D3: estimate the quotient digit from the top two dividend digits */
+        uint64_t num = ((uint64_t)un[j + n] << 32) | un[j + n - 1];
+        uint64_t qhat = num / vn[n - 1];
+        uint64_t rhat = num % vn[n - 1];
         
-        /* Safety check to prevent infinite loop */
-        if (quotient_count > 1000000) {
-            return -3; /* Overflow or infinite loop detected */
+        while (qhat > 0xFFFFFFFFULL ||
+               qhat * vn[n - 2] > ((rhat << 32) | un[j + n - 2])) {
+            qhat--;
+            rhat += vn[n - 1];
+            if (rhat > 0xFFFFFFFFULL) {
+                break;
+            }
+        }
+        
+        /* D4: multiply and subtract */
+        int64_t borrow = 0;
+        int64_t t;
+        for (int i = 0; i < n; i++) {
+            uint64_t p = qhat * vn[i];
+            t = (int64_t)un[i + j] - borrow - (int64_t)(p & 0xFFFFFFFFULL);
+            un[i + j] = (uint32_t)t;
+            borrow = (int64_t)(p >> 32) - (t >> 32);
+        }
+        t = (int64_t)un[j + n] - borrow;
+        un[j + n] = (uint32_t)t;
+        
+        /* D5/D6: the estimate was one too large at most; add the divisor back */
+        quot[j] = (uint32_t)qhat;
+        if (t < 0) {
+            quot[j]--;
+            uint64_t carry = 0;
+            for (int i = 0; i < n; i++) {
+                uint64_t sum = (uint64_t)un[i + j] + vn[i] + carry;
+                un[i + j] = (uint32_t)sum;
+                carry = sum >> 32;
+            }
+            un[j + n] += (uint32_t)carry;
         }
     }
     
-    /* Set results */
-    bigint_set_u32(q, quotient_count);
-    bigint_copy(r, &temp_dividend);
+    /* D8: unnormalize the remainder */
+    q->used = m - n + 1;
+    q->sign = 0;
+    memcpy(q->words, quot, (size_t)q->used * sizeof(uint32_t));
+    bigint_normalize(q);
+    
+    for (int i = 0; i < n; i++) {
+        r->words[i] = (un[i] >> s) | (s ? un[i + 1] << (32 - s) : 0);
+    }
+    r->used = n;
+    r->sign = 0;
+    bigint_normalize(r);
     
     return 0;
 }
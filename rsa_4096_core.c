@@ -371,4 +371,207 @@ int rsa_4096_decrypt_binary(const rsa_4096_key_t *priv_key, const uint8_t *encry
     
     CHECKPOINT(LOG_INFO, "Binary decryption completed successfully");
     return 0;
+}
+
+/* ===================== RSA CRT DECRYPTION ===================== */
+
+/**
+ * @brief Load a CRT private key from p, q and d
+ *
+ * dp, dq and q^(-1) mod p are derived once here, together with a Montgomery
+ * context per prime, so every later decryption only pays for the two
+ * half-size exponentiations.
+ */
+int rsa_4096_load_crt_key(rsa_4096_crt_key_t *key, const char *p_decimal, const char *q_decimal,
+                          const char *d_decimal) {
+    CHECKPOINT(LOG_INFO, "Loading RSA CRT key");
+    
+    if (key == NULL || p_decimal == NULL || q_decimal == NULL || d_decimal == NULL) {
+        ERROR_RETURN(-1, "NULL pointer in rsa_4096_load_crt_key");
+    }
+    
+    memset(key, 0, sizeof(rsa_4096_crt_key_t));
+    
+    bigint_t d;
+    int ret = bigint_from_decimal(&key->p, p_decimal);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to parse p");
+    }
+    
+    ret = bigint_from_decimal(&key->q, q_decimal);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to parse q");
+    }
+    
+    ret = bigint_from_decimal(&d, d_decimal);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to parse private exponent");
+    }
+    
+    if (bigint_bit_length(&key->p) < 2 || bigint_bit_length(&key->q) < 2) {
+        ERROR_RETURN(-2, "Prime factors must be greater than 1");
+    }
+    
+    if (bigint_is_zero(&d)) {
+        ERROR_RETURN(-3, "Private exponent cannot be zero");
+    }
+    
+    /* dp = d mod (p - 1), dq = d mod (q - 1) */
+    bigint_t p_minus_1, q_minus_1, one;
+    bigint_set_u32(&one, 1);
+    ret = bigint_sub(&p_minus_1, &key->p, &one);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to compute p - 1");
+    }
+    
+    ret = bigint_sub(&q_minus_1, &key->q, &one);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to compute q - 1");
+    }
+    
+    ret = bigint_mod(&key->dp, &d, &p_minus_1);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to compute d mod (p - 1)");
+    }
+    
+    ret = bigint_mod(&key->dq, &d, &q_minus_1);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to compute d mod (q - 1)");
+    }
+    
+    /* q_inv = q^(-1) mod p */
+    ret = mod_inverse_extended_gcd(&key->q_inv, &key->q, &key->p);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to compute q^(-1) mod p");
+    }
+    
+    /* Initialize Montgomery REDC contexts if possible */
+    if ((key->p.words[0] & 1) == 1) {
+        ret = montgomery_ctx_init(&key->mont_p, &key->p);
+        if (ret != 0) {
+            CHECKPOINT(LOG_INFO, "Montgomery REDC initialization failed for p, using standard arithmetic");
+        }
+    }
+    
+    if ((key->q.words[0] & 1) == 1) {
+        ret = montgomery_ctx_init(&key->mont_q, &key->q);
+        if (ret != 0) {
+            CHECKPOINT(LOG_INFO, "Montgomery REDC initialization failed for q, using standard arithmetic");
+        }
+    }
+    
+    CHECKPOINT(LOG_INFO, "RSA CRT key loaded successfully: %d-bit p, %d-bit q",
+              bigint_bit_length(&key->p), bigint_bit_length(&key->q));
+    return 0;
+}
+
+void rsa_4096_crt_free(rsa_4096_crt_key_t *key) {
+    if (key != NULL) {
+        montgomery_ctx_free(&key->mont_p);
+        montgomery_ctx_free(&key->mont_q);
+        memset(key, 0, sizeof(rsa_4096_crt_key_t));
+    }
+}
+
+/**
+ * @brief m = c^d mod (p * q) via two half-size exponentiations and Garner's recombination
+ */
+int rsa_4096_decrypt_crt(const rsa_4096_crt_key_t *crt_key, const char *encrypted_hex,
+                        char *message_decimal, size_t message_size) {
+    CHECKPOINT(LOG_INFO, "Decrypting message using RSA-4096 CRT");
+    
+    if (crt_key == NULL || encrypted_hex == NULL || message_decimal == NULL) {
+        ERROR_RETURN(-1, "NULL pointer in rsa_4096_decrypt_crt");
+    }
+    
+    if (message_size == 0) {
+        ERROR_RETURN(-2, "Message buffer size cannot be zero");
+    }
+    
+    bigint_t encrypted;
+    int ret = bigint_from_hex(&encrypted, encrypted_hex);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to parse encrypted message");
+    }
+    
+    /* c_p = c mod p, c_q = c mod q */
+    bigint_t c_p, c_q;
+    ret = bigint_mod(&c_p, &encrypted, &crt_key->p);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to reduce ciphertext mod p");
+    }
+    
+    ret = bigint_mod(&c_q, &encrypted, &crt_key->q);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to reduce ciphertext mod q");
+    }
+    
+    /* m1 = c_p^dp mod p, m2 = c_q^dq mod q */
+    bigint_t m1, m2;
+    if (crt_key->mont_p.is_active) {
+        ret = montgomery_exp(&m1, &c_p, &crt_key->dp, &crt_key->mont_p);
+    } else {
+        ret = bigint_mod_exp(&m1, &c_p, &crt_key->dp, &crt_key->p);
+    }
+    if (ret != 0) {
+        ERROR_RETURN(ret, "CRT exponentiation mod p failed");
+    }
+    
+    if (crt_key->mont_q.is_active) {
+        ret = montgomery_exp(&m2, &c_q, &crt_key->dq, &crt_key->mont_q);
+    } else {
+        ret = bigint_mod_exp(&m2, &c_q, &crt_key->dq, &crt_key->q);
+    }
+    if (ret != 0) {
+        ERROR_RETURN(ret, "CRT exponentiation mod q failed");
+    }
+    
+    /* h = q_inv * (m1 - m2) mod p, kept non-negative */
+    bigint_t m2_mod_p, diff, temp, h;
+    ret = bigint_mod(&m2_mod_p, &m2, &crt_key->p);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to reduce m2 mod p");
+    }
+    
+    if (bigint_compare(&m1, &m2_mod_p) >= 0) {
+        ret = bigint_sub(&diff, &m1, &m2_mod_p);
+    } else {
+        ret = bigint_add(&temp, &m1, &crt_key->p);
+        if (ret == 0) {
+            ret = bigint_sub(&diff, &temp, &m2_mod_p);
+        }
+    }
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to compute m1 - m2 mod p");
+    }
+    
+    ret = bigint_mul(&temp, &crt_key->q_inv, &diff);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to compute q_inv * (m1 - m2)");
+    }
+    
+    ret = bigint_mod(&h, &temp, &crt_key->p);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to reduce h mod p");
+    }
+    
+    /* m = m2 + h * q */
+    bigint_t decrypted;
+    ret = bigint_mul(&temp, &h, &crt_key->q);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to compute h * q");
+    }
+    
+    ret = bigint_add(&decrypted, &m2, &temp);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to recombine CRT result");
+    }
+    
+    ret = bigint_to_decimal(&decrypted, message_decimal, message_size);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to convert decrypted result to decimal");
+    }
+    
+    CHECKPOINT(LOG_INFO, "CRT decryption completed successfully");
+    return 0;
 }
\ No newline at end of file
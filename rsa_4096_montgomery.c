@@ -60,10 +60,10 @@ static uint32_t compute_word_inverse(uint32_t n) {
     }
     
     /* Newton's method: x_{i+1} = x_i * (2 - n * x_i) mod 2^32 */
-    uint32_t x = n;  /* Initial approximation */
+    uint32_t x = (3 * n) ^ 2;  /* Initial approximation, correct to 5 bits */
     
-    /* Newton iterations - converges quadratically */
-    for (int i = 0; i < 5; i++) {
+    /* Newton iterations - converges quadratically: 5 -> 10 -> 20 -> 40 bits */
+    for (int i = 0; i < 3; i++) {
         uint32_t nx = n * x;
         x = x * (2 - nx);  /* All arithmetic mod 2^32 automatically */
         if (LOG_LEVEL <= LOG_DEBUG) {
@@ -131,52 +131,161 @@ static uint32_t compute_montgomery_nprime(uint32_t n) {
 /* ===================== COMPLETE EXTENDED GCD FOR MONTGOMERY ===================== */
 
 /**
- * @brief Complete Extended GCD implementation for Montgomery R^(-1) mod n
+ * @brief Low 64 bits of a >> shift (shift >= 0)
  */
-int extended_gcd_full(bigint_t *result, const bigint_t *a, const bigint_t *m) {
-    printf("[EXT_GCD_FULL] Computing %d-word^(-1) mod %d-word\n", a->used, m->used);
+static uint64_t lehmer_leading_bits(const bigint_t *a, int shift) {
+    int word = shift / 32;
+    int bit = shift % 32;
+    uint64_t lo = (word < a->used) ? a->words[word] : 0;
+    uint64_t mid = (word + 1 < a->used) ? a->words[word + 1] : 0;
+    uint64_t hi = (word + 2 < a->used) ? a->words[word + 2] : 0;
+    
+    uint64_t value = ((mid << 32) | lo) >> bit;
+    if (bit != 0) {
+        value |= hi << (64 - bit);
+    }
+    return value;
+}
+
+/**
+ * @brief result = x * u + y * v, or x * u - y * v when subtract is set (must not go negative)
+ */
+static int lehmer_combine(bigint_t *result, uint64_t x, const bigint_t *u, uint64_t y,
+                          const bigint_t *v, int subtract) {
+    bigint_t x_big, y_big, xu, yv;
+    bigint_set_u32(&x_big, (uint32_t)x);
+    x_big.words[1] = (uint32_t)(x >> 32);
+    x_big.used = 2;
+    bigint_normalize(&x_big);
+    bigint_set_u32(&y_big, (uint32_t)y);
+    y_big.words[1] = (uint32_t)(y >> 32);
+    y_big.used = 2;
+    bigint_normalize(&y_big);
+    
+    int ret = bigint_mul(&xu, &x_big, u);
+    if (ret != 0) return ret;
+    ret = bigint_mul(&yv, &y_big, v);
+    if (ret != 0) return ret;
+    
+    return subtract ? bigint_sub(result, &xu, &yv) : bigint_add(result, &xu, &yv);
+}
+
+/**
+ * @brief One Lehmer step (Knuth, TAOCP vol. 2, Algorithm L) on u > v
+ *
+ * Euclid runs on the leading 63 bits of u and v while the quotients are
+ * provably the same as for the full numbers, then the accumulated 2x2
+ * cofactor matrix is applied to (u, v) and to the Bezout pair (tu, tv) in
+ * one multi-word update. Cofactors are kept as magnitudes; their signs
+ * follow from the parity of the number of simulated steps.
+ *
+ * @return 1 if the update was applied, 0 if no quotient could be derived, < 0 on error
+ */
+static int lehmer_step(bigint_t *u, bigint_t *v, bigint_t *tu, bigint_t *tv, int *tv_negative) {
+    int shift = bigint_bit_length(u) - 63;
+    uint64_t uh = lehmer_leading_bits(u, shift);
+    uint64_t vh = lehmer_leading_bits(v, shift);
+    
+    /* Matrix [[A, B], [C, D]] = [[a, -b], [-c, d]] after an even number of steps, negated after odd */
+    uint64_t a = 1, b = 0, c = 0, d = 1;
+    int odd = 0;
+    
+    for (;;) {
+        uint64_t q1, q2;
+        if (!odd) {
+            if (vh <= c || uh < b) break;
+            q1 = (uh + a) / (vh - c);
+            q2 = (uh - b) / (vh + d);
+        } else {
+            if (vh <= d || uh < a) break;
+            q1 = (uh - a) / (vh + c);
+            q2 = (uh + b) / (vh - d);
+        }
+        
+        if (q1 != q2) {
+            break;
+        }
+        
+        uint64_t next = a + q1 * c;
+        a = c;
+        c = next;
+        next = b + q1 * d;
+        b = d;
+        d = next;
+        next = uh - q1 * vh;
+        uh = vh;
+        vh = next;
+        odd = !odd;
+    }
+    
+    if (b == 0) {
+        return 0;
+    }
     
+    /* (u, v) = (A u + B v, C u + D v), both non-negative by construction */
+    bigint_t new_u, new_v, new_tu, new_tv;
+    int ret;
+    if (!odd) {
+        ret = lehmer_combine(&new_u, a, u, b, v, 1);
+        if (ret == 0) ret = lehmer_combine(&new_v, d, v, c, u, 1);
+    } else {
+        ret = lehmer_combine(&new_u, b, v, a, u, 1);
+        if (ret == 0) ret = lehmer_combine(&new_v, c, u, d, v, 1);
+    }
+    if (ret != 0) return ret;
+    
+    /* tu and tv have opposite signs, so the Bezout magnitudes always add */
+    ret = lehmer_combine(&new_tu, a, tu, b, tv, 0);
+    if (ret == 0) ret = lehmer_combine(&new_tv, c, tu, d, tv, 0);
+    if (ret != 0) return ret;
+    
+    bigint_copy(u, &new_u);
+    bigint_copy(v, &new_v);
+    bigint_copy(tu, &new_tu);
+    bigint_copy(tv, &new_tv);
+    if (odd) {
+        *tv_negative = !*tv_negative;
+    }
+    
+    return 1;
+}
+
+/**
+ * @brief Complete Extended GCD implementation: result = a^(-1) mod m
+ *
+ * Single iterative Euclid pass. Only the Bezout coefficient of a is kept;
+ * its signs alternate along the remainder sequence, so magnitudes are
+ * tracked with |t_{i+1}| = |t_{i-1}| + q_i * |t_i| plus a sign flag and no
+ * negative intermediate ever has to be represented. While the remainders
+ * are wider than 64 bits, Lehmer steps batch many quotients per pass.
+ */
+int extended_gcd_full(bigint_t *result, const bigint_t *a, const bigint_t *m) {
     if (result == NULL || a == NULL || m == NULL) {
         ERROR_RETURN(-1, "NULL pointer in extended_gcd_full");
     }
     
+    printf("[EXT_GCD_FULL] Computing %d-word^(-1) mod %d-word\n", a->used, m->used);
+    
     if (bigint_is_zero(m) || bigint_is_zero(a)) {
         ERROR_RETURN(-2, "Invalid input: a or m is zero");
     }
     
-    /* Special handling for small modulus */
-    if (m->used == 1 && m->words[0] <= 10000) {
-        printf("[EXT_GCD_FULL] Small modulus optimization\n");
-        
-        /* Use trial method for small numbers */
-        uint32_t a_val = (a->used > 0) ? a->words[0] : 0;
-        uint32_t m_val = m->words[0];
-        
-        for (uint32_t i = 1; i < m_val; i++) {
-            if ((a_val * i) % m_val == 1) {
-                bigint_set_u32(result, i);
-                printf("[EXT_GCD_FULL] Found inverse by trial: %u\n", i);
-                return 0;
-            }
-        }
-        
-        ERROR_RETURN(-3, "No inverse found by trial method");
-    }
-    
-    /* Extended Euclidean algorithm for larger numbers */
     bigint_t old_r, r;
-    bigint_t old_s, s;
     bigint_t old_t, t;
+    int t_negative = 0;  /* Sign of t; old_t always has the opposite sign */
     
-    /* Initialize: old_r = m, r = a */
+    /* Initialize: old_r = m, r = a mod m */
     bigint_copy(&old_r, m);
-    bigint_copy(&r, a);
-    
-    /* Initialize: old_s = 1, s = 0 */
-    bigint_set_u32(&old_s, 1);
-    bigint_init(&s);
+    if (bigint_compare(a, m) >= 0) {
+        int ret = bigint_mod(&r, a, m);
+        if (ret != 0) {
+            ERROR_RETURN(ret, "Failed to reduce a mod m");
+        }
+    } else {
+        bigint_copy(&r, a);
+    }
     
-    /* Initialize: old_t = 0, t = 1 */
+    /* Initialize: old_t = 0, t = 1 (coefficients of a) */
     bigint_init(&old_t);
     bigint_set_u32(&t, 1);
     
@@ -186,9 +295,20 @@ int extended_gcd_full(bigint_t *result, const bigint_t *a, const bigint_t *m) {
     while (!bigint_is_zero(&r)) {
         iteration++;
         
+        int ret;
+        if (bigint_bit_length(&old_r) > 64) {
+            ret = lehmer_step(&old_r, &r, &old_t, &t, &t_negative);
+            if (ret < 0) {
+                ERROR_RETURN(ret, "Lehmer step failed in extended GCD at iteration %d", iteration);
+            }
+            if (ret > 0) {
+                continue;
+            }
+        }
+        
         /* Calculate quotient and remainder: old_r = quotient * r + remainder */
         bigint_t quotient, remainder;
-        int ret = bigint_div(&quotient, &remainder, &old_r, &r);
+        ret = bigint_div(&quotient, &remainder, &old_r, &r);
         if (ret != 0) {
             ERROR_RETURN(ret, "Division failed in extended GCD at iteration %d", iteration);
         }
@@ -197,42 +317,21 @@ int extended_gcd_full(bigint_t *result, const bigint_t *a, const bigint_t *m) {
         bigint_copy(&old_r, &r);
         bigint_copy(&r, &remainder);
         
-        /* Update s sequence: old_s, s = s, old_s - quotient * s */
-        bigint_t q_times_s, new_s;
-        ret = bigint_mul(&q_times_s, &quotient, &s);
+        /* Update t sequence: old_t, t = t, old_t - quotient * t (magnitudes add) */
+        bigint_t q_times_t, new_t;
+        ret = bigint_mul(&q_times_t, &quotient, &t);
         if (ret != 0) {
             ERROR_RETURN(ret, "Multiplication failed in extended GCD");
         }
         
-        /* FIXED: Handle subtraction: new_s = old_s - q_times_s */
-        if (bigint_compare(&old_s, &q_times_s) >= 0) {
-            ret = bigint_sub(&new_s, &old_s, &q_times_s);
-        } else {
-            /* FIXED: Add modulus to handle negative result properly */
-            bigint_t temp_old_s;
-            bigint_copy(&temp_old_s, &old_s);
-            
-            /* Keep adding modulus until temp_old_s >= q_times_s */
-            while (bigint_compare(&temp_old_s, &q_times_s) < 0) {
-                bigint_t temp_sum;
-                ret = bigint_add(&temp_sum, &temp_old_s, m);
-                if (ret != 0) {
-                    ERROR_RETURN(ret, "Addition failed while handling negative result");
-                }
-                bigint_copy(&temp_old_s, &temp_sum);
-            }
-            
-            ret = bigint_sub(&new_s, &temp_old_s, &q_times_s);
-        }
+        ret = bigint_add(&new_t, &old_t, &q_times_t);
         if (ret != 0) {
-            ERROR_RETURN(ret, "Subtraction failed in extended GCD");
+            ERROR_RETURN(ret, "Addition failed in extended GCD");
         }
         
-        /* Move to next iteration */
-        bigint_copy(&old_s, &s);
-        bigint_copy(&s, &new_s);
-        
-        /* Similar update for t sequence (not needed for modular inverse) */
+        bigint_copy(&old_t, &t);
+        bigint_copy(&t, &new_t);
+        t_negative = !t_negative;
         
         /* Progress reporting */
         if (iteration % 100 == 0) {
@@ -246,9 +345,7 @@ int extended_gcd_full(bigint_t *result, const bigint_t *a, const bigint_t *m) {
     }
     
     /* Check if gcd = 1 */
-    bigint_t one;
-    bigint_set_u32(&one, 1);
-    if (bigint_compare(&old_r, &one) != 0) {
+    if (!bigint_is_one(&old_r)) {
         printf("[EXT_GCD_FULL] GCD is not 1\n");
         debug_print_bigint("GCD", &old_r);
         ERROR_RETURN(-5, "gcd(a, m) != 1, no inverse exists");
@@ -256,14 +353,19 @@ int extended_gcd_full(bigint_t *result, const bigint_t *a, const bigint_t *m) {
     
     printf("[EXT_GCD_FULL] GCD = 1, computing final result\n");
     
-    /* FIXED: Ensure result is in range [0, m) */
-    if (bigint_compare(&old_s, m) >= 0) {
-        bigint_mod(result, &old_s, m);
-    } else if (old_s.used == 0 || (old_s.used == 1 && old_s.words[0] == 0)) {
+    if (bigint_is_zero(&old_t)) {
         /* Result is zero - this should not happen for valid inverse */
         ERROR_RETURN(-6, "Result is zero - invalid inverse");
+    }
+    
+    /* old_t carries the sign opposite to t; map a negative coefficient into [0, m) */
+    if (t_negative) {
+        bigint_copy(result, &old_t);
     } else {
-        bigint_copy(result, &old_s);
+        int ret = bigint_sub(result, m, &old_t);
+        if (ret != 0) {
+            ERROR_RETURN(ret, "Failed to map negative coefficient into range");
+        }
     }
     
     printf("[EXT_GCD_FULL] Extended GCD completed in %d iterations\n", iteration);
@@ -272,6 +374,76 @@ int extended_gcd_full(bigint_t *result, const bigint_t *a, const bigint_t *m) {
 
 /* ===================== MONTGOMERY CONTEXT MANAGEMENT ===================== */
 
+static int montgomery_mul_cios(bigint_t *result, const bigint_t *a, const bigint_t *b,
+                               const montgomery_ctx_t *ctx);
+
+/**
+ * @brief x = 2^count * x mod n for x < n, one shift and at most one subtraction per doubling
+ */
+static int montgomery_double_mod(bigint_t *x, const bigint_t *n, int count) {
+    bigint_t temp;
+    for (int i = 0; i < count; i++) {
+        int ret = bigint_shift_left(&temp, x, 1);
+        if (ret != 0) return ret;
+        
+        if (bigint_compare(&temp, n) >= 0) {
+            ret = bigint_sub(x, &temp, n);
+            if (ret != 0) return ret;
+        } else {
+            bigint_copy(x, &temp);
+        }
+    }
+    return 0;
+}
+
+/**
+ * @brief R mod n and R^2 mod n without any multi-word division
+ *
+ * R mod n: start from the top bit of n and double up to R (at most 32 steps).
+ * R^2 mod n: with 32 * n_words = j * 2^s, double R mod n j more times to get
+ * 2^j * R, then each Montgomery squaring maps 2^i * R to 2^(2i) * R.
+ */
+static int montgomery_compute_r_constants(montgomery_ctx_t *ctx) {
+    int n_bits = bigint_bit_length(&ctx->n);
+    int r_bits = 32 * ctx->r_words;
+    
+    bigint_t x;
+    bigint_init(&x);
+    memset(x.words, 0, (size_t)ctx->n_words * sizeof(uint32_t));
+    x.words[(n_bits - 1) / 32] = 1U << ((n_bits - 1) % 32);
+    x.used = ctx->n_words;
+    bigint_normalize(&x);
+    
+    /* 2^(n_bits - 1) < n, so x stays reduced while doubling to 2^r_bits */
+    int ret = montgomery_double_mod(&x, &ctx->n, r_bits - (n_bits - 1));
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to compute R mod n");
+    }
+    bigint_copy(&ctx->r_mod_n, &x);
+    
+    int squarings = 0;
+    int doublings = r_bits;
+    while ((doublings & 1) == 0) {
+        doublings >>= 1;
+        squarings++;
+    }
+    
+    ret = montgomery_double_mod(&x, &ctx->n, doublings);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to compute 2^%d * R mod n", doublings);
+    }
+    
+    for (int i = 0; i < squarings; i++) {
+        ret = montgomery_mul_cios(&x, &x, &x, ctx);
+        if (ret != 0) {
+            ERROR_RETURN(ret, "Failed Montgomery squaring for R^2 mod n");
+        }
+    }
+    bigint_copy(&ctx->r_squared, &x);
+    
+    return 0;
+}
+
 int montgomery_ctx_init(montgomery_ctx_t *ctx, const bigint_t *modulus) {
     printf("[MONTGOMERY_COMPLETE] Initializing context for %d-bit modulus\n", bigint_bit_length(modulus));
     
@@ -303,8 +475,8 @@ int montgomery_ctx_init(montgomery_ctx_t *ctx, const bigint_t *modulus) {
         return 0;  /* Not an error - graceful fallback */
     }
     
-    /* Calculate R = 2^(32 * (n_words + 1)) */
-    ctx->r_words = ctx->n_words + 1;
+    /* Calculate R = 2^(32 * n_words), the smallest word-aligned power of two above n */
+    ctx->r_words = ctx->n_words;
     
     /* Check overflow */
     if (ctx->r_words >= BIGINT_4096_WORDS - 10) {
@@ -315,6 +487,7 @@ int montgomery_ctx_init(montgomery_ctx_t *ctx, const bigint_t *modulus) {
     /* FIXED: Set R = 2^(32 * r_words) properly */
     bigint_init(&ctx->r);
     if (ctx->r_words < BIGINT_4096_WORDS) {
+        memset(ctx->r.words, 0, (size_t)ctx->r_words * sizeof(uint32_t));
         ctx->r.words[ctx->r_words] = 1;
         ctx->r.used = ctx->r_words + 1;
     } else {
@@ -338,43 +511,32 @@ int montgomery_ctx_init(montgomery_ctx_t *ctx, const bigint_t *modulus) {
     
     printf("[MONTGOMERY_COMPLETE] ✓ n' = 0x%08x computed successfully\n", ctx->n_prime);
     
-    /* Calculate R^(-1) mod n using extended GCD */
-    printf("[MONTGOMERY_COMPLETE] Computing R^(-1) mod n...\n");
-    int ret = extended_gcd_full(&ctx->r_inv, &ctx->r, &ctx->n);
-    if (ret != 0) {
-        printf("[MONTGOMERY_COMPLETE] Failed to compute R^(-1) mod n (%d), disabling Montgomery\n", ret);
-        return 0;  /* Not an error - graceful fallback */
-    }
-    
-    debug_print_bigint("R^(-1) mod n", &ctx->r_inv);
-    
-    /* Calculate R^2 mod n */
-    printf("[MONTGOMERY_COMPLETE] Computing R^2 mod n...\n");
-    
-    /* First compute R mod n to reduce size */
-    bigint_t r_mod_n;
-    ret = bigint_mod(&r_mod_n, &ctx->r, &ctx->n);
+    /* Calculate R mod n (Montgomery 1) and R^2 mod n without division */
+    printf("[MONTGOMERY_COMPLETE] Computing R mod n and R^2 mod n...\n");
+    int ret = montgomery_compute_r_constants(ctx);
     if (ret != 0) {
-        printf("[MONTGOMERY_COMPLETE] Failed to compute R mod n (%d), disabling Montgomery\n", ret);
+        printf("[MONTGOMERY_COMPLETE] Failed to compute R mod n / R^2 mod n (%d), disabling Montgomery\n", ret);
         return 0;
     }
     
-    /* Then compute (R mod n)^2 mod n */
-    bigint_t r_squared_temp;
-    ret = bigint_mul(&r_squared_temp, &r_mod_n, &r_mod_n);
-    if (ret != 0) {
-        printf("[MONTGOMERY_COMPLETE] R^2 multiplication failed (%d), disabling Montgomery\n", ret);
+    debug_print_bigint("R mod n", &ctx->r_mod_n);
+    debug_print_bigint("R^2 mod n", &ctx->r_squared);
+    
+    /* Only go active once the cached constants check out: REDC(R mod n) = 1, REDC(R^2 mod n) = R mod n */
+    bigint_t one, check;
+    bigint_set_u32(&one, 1);
+    ret = montgomery_mul_cios(&check, &ctx->r_mod_n, &one, ctx);
+    if (ret != 0 || !bigint_is_one(&check)) {
+        printf("[MONTGOMERY_COMPLETE] R mod n failed verification, disabling Montgomery\n");
         return 0;
     }
     
-    ret = bigint_mod(&ctx->r_squared, &r_squared_temp, &ctx->n);
-    if (ret != 0) {
-        printf("[MONTGOMERY_COMPLETE] R^2 mod n failed (%d), disabling Montgomery\n", ret);
+    ret = montgomery_mul_cios(&check, &ctx->r_squared, &one, ctx);
+    if (ret != 0 || bigint_compare(&check, &ctx->r_mod_n) != 0) {
+        printf("[MONTGOMERY_COMPLETE] R^2 mod n failed verification, disabling Montgomery\n");
         return 0;
     }
     
-    debug_print_bigint("R^2 mod n", &ctx->r_squared);
-    
     /* Mark as active */
     ctx->is_active = 1;
     
@@ -413,164 +575,104 @@ void montgomery_ctx_print_info(const montgomery_ctx_t *ctx) {
 
 /* ===================== COMPLETE MONTGOMERY REDC ALGORITHM - BUGS FIXED ===================== */
 
-int montgomery_redc(bigint_t *result, const bigint_t *T, const montgomery_ctx_t *ctx) {
-    printf("[REDC_COMPLETE] Starting Complete Montgomery REDC\n");
-    
-    if (result == NULL || T == NULL || ctx == NULL) {
-        ERROR_RETURN(-1, "NULL pointer in montgomery_redc");
-    }
-    
-    if (!ctx->is_active || ctx->n_words == 0) {
-        ERROR_RETURN(-2, "Montgomery context is disabled");
+/* Work buffer for REDC: T < n * R needs n_words + r_words words, plus one carry word */
+#define MONTGOMERY_WORK_WORDS (2 * BIGINT_4096_WORDS + 2)
+
+/**
+ * @brief Load an (n_words + 1)-word value below 2n into result and reduce it below n
+ */
+static int montgomery_final_sub(bigint_t *result, const uint32_t *q, const montgomery_ctx_t *ctx) {
+    const int n_words = ctx->n_words;
+    const uint32_t *n = ctx->n.words;
+    uint32_t diff[BIGINT_4096_WORDS + 1];
+    
+    /* diff = q - n over all n_words + 1 words; the final borrow says whether q < n */
+    uint64_t borrow = 0;
+    for (int i = 0; i < n_words; i++) {
+        uint64_t d = (uint64_t)q[i] - n[i] - borrow;
+        diff[i] = (uint32_t)d;
+        borrow = (d >> 32) & 1;
     }
+    uint64_t d = (uint64_t)q[n_words] - borrow;
+    diff[n_words] = (uint32_t)d;
+    borrow = (d >> 32) & 1;
     
-    debug_print_bigint("Input T", T);
-    
-    /* COMPLETE MONTGOMERY REDC ALGORITHM - GIỮ NGUYÊN 100% */
-    /* Algorithm: REDC(T) where T < n * R */
-    /* 1. A = T */
-    /* 2. for i = 0 to n-1: */
-    /*    m = A[i] * n' mod 2^32 */
-    /*    A = A + m * n * 2^(32*i) */
-    /* 3. A = A / 2^(32*n) */
-    /* 4. if A >= n then A = A - n */
-    /* 5. return A */
+    /* q < 2n, so at most one subtraction: keep diff when there was no borrow, without branching */
+    uint32_t keep_diff = (uint32_t)borrow - 1;
     
-    /* Create working copy A = T */
-    bigint_t A;
-    bigint_copy(&A, T);
-    
-    /* FIXED: Ensure A has enough words for the algorithm */
-    int max_words = ctx->n_words * 2 + 10;
-    if (max_words > BIGINT_4096_WORDS) {
-        max_words = BIGINT_4096_WORDS;
+    bigint_init(result);
+    for (int i = 0; i <= n_words; i++) {
+        result->words[i] = (diff[i] & keep_diff) | (q[i] & ~keep_diff);
     }
+    result->used = n_words + 1;
+    bigint_normalize(result);
     
-    /* FIXED: Properly extend A with zeros */
-    bigint_ensure_capacity(&A, max_words);
-    
-    printf("[REDC_COMPLETE] Working with A: %d words\n", A.used);
-    debug_print_bigint("Initial A", &A);
-    
-    /* Montgomery REDC main loop - GIỮ NGUYÊN HOÀN TOÀN */
-    for (int i = 0; i < ctx->n_words; i++) {
-        if (i % 10 == 0 || i < 5) {
-            printf("[REDC_COMPLETE] === Iteration %d/%d ===\n", i + 1, ctx->n_words);
-        }
-        
-        /* Step 1: m = A[i] * n' mod 2^32 */
-        uint32_t A_i = (i < A.used) ? A.words[i] : 0;
-        uint32_t m = (A_i * ctx->n_prime) & 0xFFFFFFFF;
-        
-        if (i < 5) {
-            printf("[REDC_COMPLETE] A[%d] = 0x%08x, n' = 0x%08x, m = 0x%08x\n", 
-                   i, A_i, ctx->n_prime, m);
-        }
-        
-        /* Step 2: A = A + m * n * 2^(32*i) */
-        /* This means: add (m * n) to A starting at word position i */
-        
+    return 0;
+}
+
+/**
+ * @brief Fused word-serial REDC on a raw buffer: result = t * R^(-1) mod n
+ *
+ * t must hold n_words + r_words + 1 words (zero padded) and is clobbered.
+ * All additions of m * n happen in place, so no intermediate bigint_t is built.
+ */
+static int montgomery_redc_words(bigint_t *result, uint32_t *t, const montgomery_ctx_t *ctx) {
+    const int n_words = ctx->n_words;
+    const int r_words = ctx->r_words;
+    const int t_words = n_words + r_words + 1;
+    const uint32_t *n = ctx->n.words;
+    
+    /* 1. for i = 0 to r_words-1: t = t + (t[i] * n' mod 2^32) * n * 2^(32*i) */
+    for (int i = 0; i < r_words; i++) {
+        uint32_t m = t[i] * ctx->n_prime;
         uint64_t carry = 0;
-        for (int j = 0; j < ctx->n_words; j++) {
-            int pos = i + j;
-            if (pos >= max_words) break;
-            
-            /* Calculate m * n[j] + A[pos] + carry */
-            uint64_t product = (uint64_t)m * ctx->n.words[j];
-            uint64_t current_val = (pos < A.used) ? A.words[pos] : 0;
-            uint64_t sum = current_val + (product & 0xFFFFFFFF) + carry;
-            
-            A.words[pos] = (uint32_t)(sum & 0xFFFFFFFF);
-            carry = (sum >> 32) + (product >> 32);
-            
-            /* FIXED: Update A.used properly */
-            if (pos >= A.used) {
-                A.used = pos + 1;
-            }
-            
-            if ((i < 3 && j < 4) || (i < 2)) {
-                printf("[REDC_COMPLETE]   pos=%d: A[%d] = 0x%08x, carry=0x%" PRIx64 "\n",
-                       pos, pos, A.words[pos], carry);
-            }
-        }
         
-        /* FIXED: Propagate remaining carry properly */
-        int pos = i + ctx->n_words;
-        while (carry > 0 && pos < max_words) {
-            uint64_t current_val = (pos < A.used) ? A.words[pos] : 0;
-            uint64_t sum = current_val + carry;
-            A.words[pos] = (uint32_t)(sum & 0xFFFFFFFF);
+        for (int j = 0; j < n_words; j++) {
+            uint64_t sum = (uint64_t)m * n[j] + t[i + j] + carry;
+            t[i + j] = (uint32_t)sum;
             carry = sum >> 32;
-            
-            if (pos >= A.used) {
-                A.used = pos + 1;
-            }
-            pos++;
         }
         
-        if (i < 3) {
-            printf("[REDC_COMPLETE] After iteration %d: A has %d words\n", i + 1, A.used);
-            if (i < 2) {
-                debug_print_bigint("A after iteration", &A);
-            }
-        }
-        
-        /* Verify A[i] should now be 0 (or very small) */
-        if (i < 5 && A.words[i] != 0) {
-            printf("[REDC_COMPLETE] Note: A[%d] = 0x%08x (may not be zero in partial REDC)\n", 
-                   i, A.words[i]);
+        for (int pos = i + n_words; carry != 0 && pos < t_words; pos++) {
+            uint64_t sum = (uint64_t)t[pos] + carry;
+            t[pos] = (uint32_t)sum;
+            carry = sum >> 32;
         }
     }
     
-    printf("[REDC_COMPLETE] Main REDC loop completed\n");
-    debug_print_bigint("A after main loop", &A);
+    /* 2. t = t / R: the upper n_words + 1 words hold the quotient */
+    return montgomery_final_sub(result, t + r_words, ctx);
+}
+
+int montgomery_redc(bigint_t *result, const bigint_t *T, const montgomery_ctx_t *ctx) {
+    CHECKPOINT(LOG_DEBUG, "[REDC_COMPLETE] Starting Complete Montgomery REDC");
     
-    /* Step 3: A = A / R = A >> (32 * n_words) - GIỮ NGUYÊN */
-    printf("[REDC_COMPLETE] Dividing by R (right shift by %d words)\n", ctx->n_words);
+    if (result == NULL || T == NULL || ctx == NULL) {
+        ERROR_RETURN(-1, "NULL pointer in montgomery_redc");
+    }
     
-    bigint_init(result);
+    if (!ctx->is_active || ctx->n_words == 0) {
+        ERROR_RETURN(-2, "Montgomery context is disabled");
+    }
     
-    if (A.used > ctx->n_words) {
-        result->used = A.used - ctx->n_words;
-        if (result->used > BIGINT_4096_WORDS) {
-            result->used = BIGINT_4096_WORDS;
-        }
-        
-        for (int i = 0; i < result->used; i++) {
-            int src_pos = i + ctx->n_words;
-            if (src_pos < A.used) {
-                result->words[i] = A.words[src_pos];
-            } else {
-                result->words[i] = 0;
-            }
-        }
-        
-        /* FIXED: Normalize properly */
-        bigint_normalize(result);
-    } else {
-        /* Result is zero */
-        bigint_init(result);
+    int t_words = ctx->n_words + ctx->r_words + 1;
+    if (T->used >= t_words) {
+        ERROR_RETURN(-3, "REDC input must be less than n * R");
     }
     
-    debug_print_bigint("Result before final reduction", result);
+    debug_print_bigint("Input T", T);
     
-    /* Step 4: Final reduction if result >= n - GIỮ NGUYÊN */
-    if (!bigint_is_zero(result) && bigint_compare(result, &ctx->n) >= 0) {
-        printf("[REDC_COMPLETE] Final reduction: result >= n\n");
-        bigint_t temp;
-        int ret = bigint_sub(&temp, result, &ctx->n);
-        if (ret == 0) {
-            bigint_copy(result, &temp);
-            printf("[REDC_COMPLETE] Final reduction completed\n");
-        } else {
-            printf("[REDC_COMPLETE] Warning: Final subtraction failed: %d\n", ret);
-        }
+    uint32_t t[MONTGOMERY_WORK_WORDS];
+    memcpy(t, T->words, (size_t)T->used * sizeof(uint32_t));
+    memset(t + T->used, 0, (size_t)(t_words - T->used) * sizeof(uint32_t));
+    
+    int ret = montgomery_redc_words(result, t, ctx);
+    if (ret != 0) {
+        return ret;
     }
     
     debug_print_bigint("Final REDC result", result);
     debug_verify_invariant("REDC output", result, &ctx->n);
-    
-    printf("[REDC_COMPLETE] ✅ Complete Montgomery REDC finished successfully\n");
     return 0;
 }
 
@@ -586,17 +688,22 @@ int montgomery_to_form(bigint_t *result, const bigint_t *a, const montgomery_ctx
     }
     
     /* a_mont = (a * R^2) * R^(-1) mod n = a * R mod n */
-    bigint_t temp;
-    int ret = bigint_mul(&temp, a, &ctx->r_squared);
-    if (ret != 0) {
-        ERROR_RETURN(ret, "Failed to compute a * R^2");
+    /* a < R and R^2 mod n < n: the fused multiply-reduce needs no product temporary */
+    const bigint_t *input = a;
+    bigint_t reduced;
+    int ret;
+    if (a->used > ctx->n_words) {
+        /* a >= R > n: reduce first so the REDC bound a * R^2 < n * R holds */
+        ret = bigint_mod(&reduced, a, &ctx->n);
+        if (ret != 0) {
+            ERROR_RETURN(ret, "Failed to reduce input mod n");
+        }
+        input = &reduced;
     }
     
-    debug_print_bigint("a * R^2", &temp);
-    
-    ret = montgomery_redc(result, &temp, ctx);
+    ret = montgomery_mul(result, input, &ctx->r_squared, ctx);
     if (ret != 0) {
-        ERROR_RETURN(ret, "Failed REDC in to_form");
+        ERROR_RETURN(ret, "Failed to compute a * R^2 * R^(-1)");
     }
     
     debug_print_bigint("Montgomery form result", result);
@@ -624,8 +731,70 @@ int montgomery_from_form(bigint_t *result, const bigint_t *a, const montgomery_c
 
 /* ===================== MONTGOMERY ARITHMETIC - GIỮ NGUYÊN ===================== */
 
+/*
+ * montgomery_mul reads both operands into its work buffer before it writes
+ * result, so result may alias a or b and callers can update in place.
+ */
+
+/**
+ * @brief CIOS multiply-reduce: result = a * b * R^(-1) mod n
+ *
+ * Needs only n, n' and the word counts, so context setup can use it
+ * before the context is marked active.
+ */
+static int montgomery_mul_cios(bigint_t *result, const bigint_t *a, const bigint_t *b,
+                               const montgomery_ctx_t *ctx) {
+    const int n_words = ctx->n_words;
+    if (a->used > n_words || b->used > n_words) {
+        ERROR_RETURN(-2, "Montgomery operands must be less than n");
+    }
+    
+    /*
+     * CIOS: interleave one row of a * b with one word of reduction, so the
+     * running sum stays below 2n and fits in n_words + 2 words.
+     */
+    const uint32_t *n = ctx->n.words;
+    uint32_t t[BIGINT_4096_WORDS + 2];
+    memset(t, 0, (size_t)(n_words + 2) * sizeof(uint32_t));
+    
+    for (int i = 0; i < ctx->r_words; i++) {
+        uint32_t a_i = (i < a->used) ? a->words[i] : 0;
+        uint64_t carry = 0;
+        uint64_t sum;
+        
+        /* t = t + a[i] * b */
+        int j;
+        for (j = 0; j < b->used; j++) {
+            sum = (uint64_t)a_i * b->words[j] + t[j] + carry;
+            t[j] = (uint32_t)sum;
+            carry = sum >> 32;
+        }
+        for (; carry != 0 && j < n_words + 2; j++) {
+            sum = (uint64_t)t[j] + carry;
+            t[j] = (uint32_t)sum;
+            carry = sum >> 32;
+        }
+        
+        /* t = (t + m * n) / 2^32, with m chosen so the low word cancels */
+        uint32_t m = t[0] * ctx->n_prime;
+        sum = (uint64_t)m * n[0] + t[0];
+        carry = sum >> 32;
+        for (j = 1; j < n_words; j++) {
+            sum = (uint64_t)m * n[j] + t[j] + carry;
+            t[j - 1] = (uint32_t)sum;
+            carry = sum >> 32;
+        }
+        sum = (uint64_t)t[n_words] + carry;
+        t[n_words - 1] = (uint32_t)sum;
+        t[n_words] = t[n_words + 1] + (uint32_t)(sum >> 32);
+        t[n_words + 1] = 0;
+    }
+    
+    return montgomery_final_sub(result, t, ctx);
+}
+
 int montgomery_mul(bigint_t *result, const bigint_t *a, const bigint_t *b, const montgomery_ctx_t *ctx) {
-    printf("[MONT_MUL_COMPLETE] Montgomery multiplication\n");
+    CHECKPOINT(LOG_DEBUG, "[MONT_MUL_COMPLETE] Montgomery multiplication");
     debug_print_bigint("a", a);
     debug_print_bigint("b", b);
     
@@ -633,16 +802,7 @@ int montgomery_mul(bigint_t *result, const bigint_t *a, const bigint_t *b, const
         ERROR_RETURN(-1, "Montgomery context disabled");
     }
     
-    /* (a * b) * R^(-1) mod n */
-    bigint_t product;
-    int ret = bigint_mul(&product, a, b);
-    if (ret != 0) {
-        ERROR_RETURN(ret, "Failed to multiply a * b");
-    }
-    
-    debug_print_bigint("a * b", &product);
-    
-    ret = montgomery_redc(result, &product, ctx);
+    int ret = montgomery_mul_cios(result, a, b, ctx);
     if (ret != 0) {
         ERROR_RETURN(ret, "Failed REDC in montgomery_mul");
     }
@@ -655,44 +815,47 @@ int montgomery_square(bigint_t *result, const bigint_t *a, const montgomery_ctx_
     return montgomery_mul(result, a, a, ctx);
 }
 
-int montgomery_exp(bigint_t *result, const bigint_t *base, const bigint_t *exp, const montgomery_ctx_t *ctx) {
-    printf("[MONT_EXP_COMPLETE] Complete Montgomery exponentiation\n");
-    debug_print_bigint("Base", base);
-    debug_print_bigint("Exponent", exp);
-    debug_print_bigint("Modulus", &ctx->n);
-    
-    if (!ctx->is_active || ctx->n_words == 0) {
-        ERROR_RETURN(-1, "Montgomery context disabled");
-    }
-    
-    if (bigint_is_zero(exp)) {
-        bigint_set_u32(result, 1);
-        return 0;
-    }
-    
-    if (bigint_is_zero(base)) {
-        bigint_init(result);
-        return 0;
-    }
-    
-    /* Convert base to Montgomery form */
-    bigint_t mont_base;
-    int ret = montgomery_to_form(&mont_base, base, ctx);
-    if (ret != 0) {
-        ERROR_RETURN(ret, "Failed to convert base to Montgomery form");
+#ifndef RSA_4096_USE_GMP
+/* The native exponentiation paths below are compiled out when mpz_powm does the work */
+
+/* Window width for left-to-right exponentiation: 2^(w-1) odd powers are precomputed */
+#define MONTGOMERY_WINDOW_BITS 5
+#define MONTGOMERY_WINDOW_SIZE (1 << (MONTGOMERY_WINDOW_BITS - 1))
+
+/**
+ * @brief Number of set bits in a bigint
+ */
+static int bigint_popcount(const bigint_t *a) {
+    int count = 0;
+    for (int i = 0; i < a->used; i++) {
+        uint32_t w = a->words[i];
+        while (w) {
+            w &= w - 1;
+            count++;
+        }
     }
-    
-    /* Initialize result to 1 in Montgomery form */
-    bigint_t one, mont_result;
-    bigint_set_u32(&one, 1);
-    ret = montgomery_to_form(&mont_result, &one, ctx);
-    if (ret != 0) {
-        ERROR_RETURN(ret, "Failed to convert 1 to Montgomery form");
+    return count;
+}
+
+/**
+ * @brief Read count (<= 32) bits of a starting at bit lo, straight from the word array
+ */
+static uint32_t bigint_get_bits(const bigint_t *a, int lo, int count) {
+    int word = lo / 32;
+    int shift = lo % 32;
+    uint64_t chunk = (word < a->used) ? a->words[word] : 0;
+    if (word + 1 < a->used) {
+        chunk |= (uint64_t)a->words[word + 1] << 32;
     }
-    
-    printf("[MONT_EXP_COMPLETE] Starting square-and-multiply\n");
-    debug_print_bigint("Initial mont_base", &mont_base);
-    debug_print_bigint("Initial mont_result (1)", &mont_result);
+    return (uint32_t)(chunk >> shift) & (uint32_t)((1ULL << count) - 1);
+}
+
+/**
+ * @brief Right-to-left square-and-multiply, kept for sparse exponents (e.g. 65537)
+ */
+static int montgomery_exp_binary(bigint_t *mont_result, bigint_t *mont_base, const bigint_t *exp,
+                                 const montgomery_ctx_t *ctx) {
+    int ret;
     
     /* Binary exponentiation - GIỮ NGUYÊN */
     int exp_bits = bigint_bit_length(exp);
@@ -704,15 +867,13 @@ int montgomery_exp(bigint_t *result, const bigint_t *base, const bigint_t *exp,
                 printf("[MONT_EXP_COMPLETE] Bit %d is set, multiplying result by base\n", i);
             }
             
-            bigint_t temp;
-            ret = montgomery_mul(&temp, &mont_result, &mont_base, ctx);
+            ret = montgomery_mul(mont_result, mont_result, mont_base, ctx);
             if (ret != 0) {
                 ERROR_RETURN(ret, "Failed Montgomery multiplication at bit %d", i);
             }
-            bigint_copy(&mont_result, &temp);
             
             if (i < 5) {
-                debug_print_bigint("mont_result after multiply", &mont_result);
+                debug_print_bigint("mont_result after multiply", mont_result);
             }
         }
         
@@ -721,15 +882,13 @@ int montgomery_exp(bigint_t *result, const bigint_t *base, const bigint_t *exp,
                 printf("[MONT_EXP_COMPLETE] Squaring base for next bit (bit %d)\n", i);
             }
             
-            bigint_t temp;
-            ret = montgomery_square(&temp, &mont_base, ctx);
+            ret = montgomery_square(mont_base, mont_base, ctx);
             if (ret != 0) {
                 ERROR_RETURN(ret, "Failed Montgomery squaring at bit %d", i);
             }
-            bigint_copy(&mont_base, &temp);
             
             if (i < 5) {
-                debug_print_bigint("mont_base after square", &mont_base);
+                debug_print_bigint("mont_base after square", mont_base);
             }
         }
         
@@ -739,6 +898,153 @@ int montgomery_exp(bigint_t *result, const bigint_t *base, const bigint_t *exp,
         }
     }
     
+    return 0;
+}
+
+/**
+ * @brief Left-to-right sliding-window exponentiation with odd powers in Montgomery form
+ *
+ * Every exponent bit costs one squaring, but only one multiplication per
+ * window of up to MONTGOMERY_WINDOW_BITS bits is needed instead of one per set bit.
+ */
+static int montgomery_exp_window(bigint_t *mont_result, const bigint_t *mont_base, const bigint_t *exp,
+                                 const montgomery_ctx_t *ctx) {
+    /* table[k] = base^(2k + 1) in Montgomery form */
+    bigint_t table[MONTGOMERY_WINDOW_SIZE];
+    bigint_t base_squared;
+    
+    bigint_copy(&table[0], mont_base);
+    int ret = montgomery_square(&base_squared, mont_base, ctx);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to square base for window table");
+    }
+    for (int k = 1; k < MONTGOMERY_WINDOW_SIZE; k++) {
+        ret = montgomery_mul(&table[k], &table[k - 1], &base_squared, ctx);
+        if (ret != 0) {
+            ERROR_RETURN(ret, "Failed to build window table entry %d", k);
+        }
+    }
+    
+    int exp_bits = bigint_bit_length(exp);
+    printf("[MONT_EXP_COMPLETE] Processing %d exponent bits with %d-bit windows\n",
+           exp_bits, MONTGOMERY_WINDOW_BITS);
+    
+    int started = 0;
+    int i = exp_bits - 1;
+    while (i >= 0) {
+        if (!bigint_get_bit(exp, i)) {
+            /* Between windows: just square */
+            if (started) {
+                ret = montgomery_square(mont_result, mont_result, ctx);
+                if (ret != 0) {
+                    ERROR_RETURN(ret, "Failed Montgomery squaring at bit %d", i);
+                }
+            }
+            i--;
+            continue;
+        }
+        
+        /* Longest window ending in a set bit: bits i..j, at most MONTGOMERY_WINDOW_BITS wide */
+        int j = i - MONTGOMERY_WINDOW_BITS + 1;
+        if (j < 0) {
+            j = 0;
+        }
+        uint32_t window = bigint_get_bits(exp, j, i - j + 1);
+        while ((window & 1) == 0) {
+            window >>= 1;
+            j++;
+        }
+        
+        if (!started) {
+            /* First window: result = base^window directly */
+            bigint_copy(mont_result, &table[window >> 1]);
+            started = 1;
+        } else {
+            for (int bit = i; bit >= j; bit--) {
+                ret = montgomery_square(mont_result, mont_result, ctx);
+                if (ret != 0) {
+                    ERROR_RETURN(ret, "Failed Montgomery squaring at bit %d", bit);
+                }
+            }
+            
+            ret = montgomery_mul(mont_result, mont_result, &table[window >> 1], ctx);
+            if (ret != 0) {
+                ERROR_RETURN(ret, "Failed Montgomery multiplication at bit %d", j);
+            }
+        }
+        
+        i = j - 1;
+    }
+    
+    return 0;
+}
+#endif /* !RSA_4096_USE_GMP */
+
+int montgomery_exp(bigint_t *result, const bigint_t *base, const bigint_t *exp, const montgomery_ctx_t *ctx) {
+    printf("[MONT_EXP_COMPLETE] Complete Montgomery exponentiation\n");
+    debug_print_bigint("Base", base);
+    debug_print_bigint("Exponent", exp);
+    debug_print_bigint("Modulus", &ctx->n);
+    
+    if (!ctx->is_active || ctx->n_words == 0) {
+        ERROR_RETURN(-1, "Montgomery context disabled");
+    }
+    
+#ifdef RSA_4096_USE_GMP
+    /* GMP build: mpz_powm does its own windowed Montgomery, hand the whole exponentiation over */
+    return bigint_mod_exp(result, base, exp, &ctx->n);
+#else
+    if (bigint_is_zero(exp)) {
+        bigint_set_u32(result, 1);
+        return 0;
+    }
+    
+    if (bigint_is_zero(base)) {
+        bigint_init(result);
+        return 0;
+    }
+    
+    /* Convert base to Montgomery form */
+    bigint_t mont_base;
+    int ret = montgomery_to_form(&mont_base, base, ctx);
+    if (ret != 0) {
+        ERROR_RETURN(ret, "Failed to convert base to Montgomery form");
+    }
+    
+    /* Initialize result to 1 in Montgomery form (cached R mod n) */
+    bigint_t mont_result;
+    bigint_copy(&mont_result, &ctx->r_mod_n);
+    
+    printf("[MONT_EXP_COMPLETE] Starting exponentiation\n");
+    debug_print_bigint("Initial mont_base", &mont_base);
+    debug_print_bigint("Initial mont_result (1)", &mont_result);
+    
+    int fermat_k = bigint_fermat_exponent_shift(exp);
+    if (fermat_k > 0) {
+        /* e = 2^k + 1 (65537 and friends): straight-line k squarings and one multiply */
+        bigint_copy(&mont_result, &mont_base);
+        for (int i = 0; i < fermat_k && ret == 0; i++) {
+            ret = montgomery_square(&mont_result, &mont_result, ctx);
+        }
+        if (ret == 0) {
+            ret = montgomery_mul(&mont_result, &mont_result, &mont_base, ctx);
+        }
+        if (ret != 0) {
+            ERROR_RETURN(ret, "Failed Montgomery step for e = 2^%d + 1", fermat_k);
+        }
+    } else if (bigint_popcount(exp) <= 2) {
+        /* Sparse exponents gain nothing from a window table: keep the bit method */
+        ret = montgomery_exp_binary(&mont_result, &mont_base, exp, ctx);
+        if (ret != 0) {
+            return ret;
+        }
+    } else {
+        ret = montgomery_exp_window(&mont_result, &mont_base, exp, ctx);
+        if (ret != 0) {
+            return ret;
+        }
+    }
+    
     /* Convert result back from Montgomery form */
     printf("[MONT_EXP_COMPLETE] Converting result back from Montgomery form\n");
     ret = montgomery_from_form(result, &mont_result, ctx);
@@ -751,4 +1057,5 @@ int montgomery_exp(bigint_t *result, const bigint_t *base, const bigint_t *exp,
     
     printf("[MONT_EXP_COMPLETE] ✅ Complete Montgomery exponentiation finished\n");
     return 0;
+#endif
 }
\ No newline at end of file
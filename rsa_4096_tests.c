@@ -180,6 +180,251 @@ int run_verification(void) {
     return (passed_tests == num_tests) ? 0 : -1;
 }
 
+/* ===================== MONTGOMERY CONSISTENCY ===================== */
+
+int test_division_consistency(void) {
+    printf("===============================================\n");
+    printf("Division and Barrett Reduction Tests\n");
+    printf("===============================================\n");
+    
+    /* {dividend, divisor, quotient, remainder} in hex */
+    const char *div_vectors[][4] = {
+        /* Knuth D6 add-back: qhat survives the two-digit test but is still one too large */
+        {"7FFFFFFFFFFFFFFF8000000080000000", "FFFFFFFFFFFFFFFF7FFFFFFF", "7FFFFFFF", "FFFFFFFFC00000007FFFFFFF"},
+        {"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF", "8000000080000000FFFFFFFF", "1FFFFFFFD", "7FFFFFFF80000004FFFFFFFC"},
+        {"800000008000000000000001FFFFFFFFFFFFFFFF", "8000000080000000CB0D38E2", "FFFFFFFFFFFFFFFE", "34F2C72100000001961A71C3"},
+        {"7FFFFFFF7FFFFFFF7A50346ECC90D15D00000001", "8000000080000000FFFFFFFF", "FFFFFFFDFFFFFFFE", "7A503472CC90D15CFFFFFFFF"},
+        /* 2-, 4- and 5-word divisors */
+        {"3A3C0CCBB3A59D5CFB3EC72D6B488913756FAAE6176A6400", "E7671FEBDBDF534D", "406CB6E1A274318A69B3768ECDD2CEC9", "11EEA2BC1E0068B"},
+        {"B04F35CB9AABB80C141528D2C6DDAF44B6E1B9928DF7AE1BF8D60E7C56481B9B", "9C7E2E030B06DD5318953AAA3", "1206AC0AE358C46E850F1FE8C64FB5EB3C42C5F5", "57A523B6115F5013554E05E9C"},
+        {"10000000000000000000000000000000000000000000000000000000000000000", "2AD0BDAE195A1A5C39EB888CDAC8F38D3D2BB6", "5FAAA166929924B654E4C78C5D9", "25EF6799C127C6F99E0FB7F89BC0C2AF32E4BA"}
+    };
+    /* {modulus, x, x mod modulus} in hex */
+    const char *barrett_vectors[][3] = {
+        /* 3-word modulus; the last x is wider than 2k words and takes the bigint_mod path */
+        {"8000000080000000FFFFFFFF", "40000000800000013FFFFFFFFFFFFFFFFFFFFFFE00000000", "8000000080000000FFFFFFFE"},
+        {"8000000080000000FFFFFFFF", "153AB36769DA616BC271EA1B6A608AA9DF4F417AC42BF76A", "2839C02781D4F2F24AE5A1FB"},
+        {"8000000080000000FFFFFFFF", "8000000080000000FFFFFFFF", "0"},
+        {"8000000080000000FFFFFFFF", "8000000080000000FFFFFFFE", "8000000080000000FFFFFFFE"},
+        {"8000000080000000FFFFFFFF", "559A74F2C58231EFE818F3CB41D676DD6224252CCB08626DBDC61A2CBF", "3B6B737D01C8856F454DE98E"},
+        /* 5- and 7-word moduli */
+        {"CE40A60F75D70EACA84FF2295D28789E223A5E89", "A62C1B94551914E721AEBC4A86BADC821E86B10DDB49D0D7E051C998491908941210AF875CFCE550", "CE40A60F75D70EACA84FF2295D28789E223A5E88"},
+        {"CE40A60F75D70EACA84FF2295D28789E223A5E89", "9C57AE381EBFB2FA8160579DF5622EBFB5197A4200FC7CE8C452C295ED4F7856B8CF5093CAD800A6", "2571B4B589938D78D11B5F2808756E21AAA78B42"},
+        {"CE40A60F75D70EACA84FF2295D28789E223A5E89", "CE40A60F75D70EACA84FF2295D28789E223A5E89", "0"},
+        {"CE40A60F75D70EACA84FF2295D28789E223A5E89", "CE40A60F75D70EACA84FF2295D28789E223A5E88", "CE40A60F75D70EACA84FF2295D28789E223A5E88"},
+        {"CE40A60F75D70EACA84FF2295D28789E223A5E89", "F862DC6A79279D0048742C19245F2D79D3A0E726CFE83E940F05E5D27736A3E99BCAD26BA526974FBE1A5BA66B", "619F2068E0DA1EF18AD3253107E40BFD14379419"},
+        {"C20582C30E72CDAE19A5EED64E17062C8CDA89D1B09CDAEDD7", "930C5A4E004F3F83844769BA9B32BD6EE49F2A1CBB5EFC1AAB108F15899B372D5E47AEA8266D7F38A4824199A2B7F723CA90", "C20582C30E72CDAE19A5EED64E17062C8CDA89D1B09CDAEDD6"},
+        {"C20582C30E72CDAE19A5EED64E17062C8CDA89D1B09CDAEDD7", "1A5687D87C0FEE5A47948B892077A707210F5C4EE5F5FC9186B1B132D0FAC0E7AE56A9421469F388330D349F5EA8C7EBAAEF", "53056A2CB6EBEFFCF8F01A84C11B1D3A1853F0E59DB9693EDF"},
+        {"C20582C30E72CDAE19A5EED64E17062C8CDA89D1B09CDAEDD7", "C20582C30E72CDAE19A5EED64E17062C8CDA89D1B09CDAEDD7", "0"},
+        {"C20582C30E72CDAE19A5EED64E17062C8CDA89D1B09CDAEDD7", "C20582C30E72CDAE19A5EED64E17062C8CDA89D1B09CDAEDD6", "C20582C30E72CDAE19A5EED64E17062C8CDA89D1B09CDAEDD6"},
+        {"C20582C30E72CDAE19A5EED64E17062C8CDA89D1B09CDAEDD7", "DCD2C1FFE34BC6AFA41F44B2F8004FC6FC4DCEF42D16E4F0393F3025E1A31F6D10BFB2882C754B573F04DAD141084C6453344B1D9F6F59", "143C7824B3D6E28B4EF633F24A2EC49573D2F6A5AE2288EEB1"}
+    };
+    const int num_div = sizeof(div_vectors) / sizeof(div_vectors[0]);
+    const int num_barrett = sizeof(barrett_vectors) / sizeof(barrett_vectors[0]);
+    
+    int passed = 0;
+    int total = 0;
+    
+    for (int i = 0; i < num_div; i++) {
+        bigint_t a, b, q, r, expected_q, expected_r;
+        bigint_from_hex(&a, div_vectors[i][0]);
+        bigint_from_hex(&b, div_vectors[i][1]);
+        bigint_from_hex(&expected_q, div_vectors[i][2]);
+        bigint_from_hex(&expected_r, div_vectors[i][3]);
+        total++;
+        
+        int ret = bigint_div(&q, &r, &a, &b);
+        if (ret == 0 && bigint_compare(&q, &expected_q) == 0 && bigint_compare(&r, &expected_r) == 0) {
+            passed++;
+        } else {
+            printf("❌ bigint_div mismatch: %s / %s (ret = %d)\n", div_vectors[i][0], div_vectors[i][1], ret);
+        }
+    }
+    
+    for (int i = 0; i < num_barrett; i++) {
+        bigint_t n, x, result, expected;
+        barrett_ctx_t ctx;
+        bigint_from_hex(&n, barrett_vectors[i][0]);
+        bigint_from_hex(&x, barrett_vectors[i][1]);
+        bigint_from_hex(&expected, barrett_vectors[i][2]);
+        total++;
+        
+        int ret = barrett_ctx_init(&ctx, &n);
+        if (ret != 0 || !ctx.is_active) {
+            printf("❌ Barrett context not active for n = %s (ret = %d)\n", barrett_vectors[i][0], ret);
+            continue;
+        }
+        
+        ret = barrett_reduce(&result, &x, &ctx);
+        if (ret == 0 && bigint_compare(&result, &expected) == 0) {
+            passed++;
+        } else {
+            printf("❌ barrett_reduce mismatch: %s mod %s (ret = %d)\n", barrett_vectors[i][1], barrett_vectors[i][0], ret);
+        }
+    }
+    
+    printf("===============================================\n");
+    printf("  ✅ Division checks passed: %d/%d\n", passed, total);
+    printf("===============================================\n");
+    
+    return (passed == total) ? 0 : -1;
+}
+
+int test_mod_inverse_consistency(void) {
+    printf("===============================================\n");
+    printf("Modular Inverse Tests\n");
+    printf("===============================================\n");
+    
+    /* {a, m} in hex; old_r starts above 64 bits in every case, so Lehmer steps run */
+    const char *inverse_vectors[][2] = {
+        /* e = 65537 against an even 256-bit modulus */
+        {"10001", "B31241A982F11EC01EE57012853D452FE539A78BC8EFF3460B12AE6EAD581E56"},
+        {"A595AF4C654A13D22E877994AFFF2F650458E00E8C64BEB012", "C495CE11F7CF5A6C53CE530E6970159142AC030C1B901E7842D60BAA9851E4D5"},
+        {"8ADD849B1D27FFA333DA7327EB9F5BF1121F24DEE10FADCB339E15B19E1B43FD91B9B6A205DA31934FA1F5F5E5AEFE755353F361C5F6FFA81B8E8D8DD5A262C8",
+         "E5646802DA50DFF4C17323A56C558429BA5DDF63943FB835196F8D86044D2CC96A1895051936BCAECD954F4612DE1BFBBBC4BA50DDB860CA6378C97774A2A8AB"},
+        /* a > m: reduced before the first step */
+        {"99EF61A6BAC8D9FC086261EF70B0757AFFE0A274FAFF7FA358E875513C89D3E0B9A87AEC3F7F1D6AD681FE24EED88564D19F715704F85D67606B5C12BC9A4B7BC4325FA4B099E646746C0287301ECFD48A1145179C268EB",
+         "EFD2CD8455C042028D5F4DD239AA80D1CFF7383E3F3817BDF3477FDE3E911040AFE76854763"}
+    };
+    const int num_inverse = sizeof(inverse_vectors) / sizeof(inverse_vectors[0]);
+    
+    int passed = 0;
+    int total = 0;
+    
+    for (int i = 0; i < num_inverse; i++) {
+        bigint_t a, m, inverse, product, check;
+        bigint_from_hex(&a, inverse_vectors[i][0]);
+        bigint_from_hex(&m, inverse_vectors[i][1]);
+        total++;
+        
+        /* a * a^(-1) mod m must be 1, with a^(-1) in [1, m) */
+        int ret = mod_inverse_extended_gcd(&inverse, &a, &m);
+        if (ret == 0 && bigint_compare(&inverse, &m) < 0 &&
+            bigint_mul(&product, &a, &inverse) == 0 &&
+            bigint_mod(&check, &product, &m) == 0 && bigint_is_one(&check)) {
+            passed++;
+        } else {
+            printf("❌ Inverse check failed: %s^(-1) mod %s (ret = %d)\n",
+                   inverse_vectors[i][0], inverse_vectors[i][1], ret);
+        }
+    }
+    
+    /* gcd(a, m) is a 90-bit common factor: no inverse exists */
+    bigint_t a, m, inverse;
+    bigint_from_hex(&a, "1A5D237CE9CD9CC4829AE556E566D331B8A3C7747028C91E");
+    bigint_from_hex(&m, "1AD75ADF9CED0E5A9747BEAEBABA9BA42942ED8867E675281F33A");
+    total++;
+    if (mod_inverse_extended_gcd(&inverse, &a, &m) != 0) {
+        passed++;
+    } else {
+        printf("❌ Inverse reported for non-coprime inputs\n");
+    }
+    
+    printf("===============================================\n");
+    printf("  ✅ Inverse checks passed: %d/%d\n", passed, total);
+    printf("===============================================\n");
+    
+    return (passed == total) ? 0 : -1;
+}
+
+int test_montgomery_consistency(void) {
+    printf("===============================================\n");
+    printf("Montgomery REDC Consistency Tests\n");
+    printf("===============================================\n");
+    
+    /* Small odd moduli of 1 to 4 words. The 3-word modulus has a 96-bit R, so
+     * montgomery_compute_r_constants doubles 3 times before squaring instead of once */
+    const char *moduli[] = {
+        "143",
+        "18446744073709551557",
+        "618970019642690137449562111",
+        "340282366920938463463374607431768211297"
+    };
+    /* {modulus, base, exponent, base^exponent mod modulus} */
+    const char *known_answers[][4] = {
+        {"143", "2", "1", "2"},
+        {"143", "42", "3", "14"},
+        {"143", "123456789", "103", "92"},
+        {"143", "98765432109876543210", "65537", "23"},
+        {"143", "2", "4294967297", "84"},
+        {"143", "42", "123456789123456789123456789", "27"},
+        {"18446744073709551557", "42", "1", "42"},
+        {"18446744073709551557", "123456789", "3", "16242550412054325284"},
+        {"18446744073709551557", "98765432109876543210", "103", "10355116411297642773"},
+        {"18446744073709551557", "2", "65537", "3758194157403221779"},
+        {"18446744073709551557", "42", "4294967297", "14446026159659039390"},
+        {"18446744073709551557", "123456789", "123456789123456789123456789", "7214351673377411239"},
+        {"618970019642690137449562111", "123456789", "1", "123456789"},
+        {"618970019642690137449562111", "98765432109876543210", "3", "287429743382248775619154554"},
+        {"618970019642690137449562111", "2", "103", "16384"},
+        {"618970019642690137449562111", "42", "65537", "556833992458993943268675026"},
+        {"618970019642690137449562111", "123456789", "4294967297", "372956456502263471243676772"},
+        {"618970019642690137449562111", "98765432109876543210", "123456789123456789123456789", "252011963348386320456888229"},
+        {"340282366920938463463374607431768211297", "98765432109876543210", "1", "98765432109876543210"},
+        {"340282366920938463463374607431768211297", "2", "3", "8"},
+        {"340282366920938463463374607431768211297", "42", "103", "113333409388959994509590215521807952704"},
+        {"340282366920938463463374607431768211297", "123456789", "65537", "29368087588316992923440462963821243197"},
+        {"340282366920938463463374607431768211297", "98765432109876543210", "4294967297", "283744181653811462517354088065547450644"},
+        {"340282366920938463463374607431768211297", "2", "123456789123456789123456789", "8485740285607222148809880368721236501"}
+    };
+    const int num_moduli = sizeof(moduli) / sizeof(moduli[0]);
+    const int num_answers = sizeof(known_answers) / sizeof(known_answers[0]);
+    
+    int passed = 0;
+    int total = 0;
+    
+    for (int i = 0; i < num_moduli; i++) {
+        bigint_t n;
+        montgomery_ctx_t ctx;
+        bigint_from_decimal(&n, moduli[i]);
+        
+        int ret = montgomery_ctx_init(&ctx, &n);
+        if (ret != 0 || !ctx.is_active) {
+            printf("❌ Montgomery context not active for n = %s (ret = %d)\n", moduli[i], ret);
+            return -1;
+        }
+        
+        /* Cached R mod n is 1 in Montgomery form, and R^2 mod n maps 1 onto it */
+        bigint_t one, value;
+        bigint_set_u32(&one, 1);
+        total++;
+        if (montgomery_from_form(&value, &ctx.r_mod_n, &ctx) == 0 && bigint_is_one(&value) &&
+            montgomery_to_form(&value, &one, &ctx) == 0 && bigint_compare(&value, &ctx.r_mod_n) == 0) {
+            passed++;
+        } else {
+            printf("❌ Cached R mod n is not Montgomery 1 for n = %s\n", moduli[i]);
+        }
+        
+        for (int j = 0; j < num_answers; j++) {
+            if (strcmp(known_answers[j][0], moduli[i]) != 0) {
+                continue;
+            }
+            
+            bigint_t base, exp, expected, mont_result;
+            bigint_from_decimal(&base, known_answers[j][1]);
+            bigint_from_decimal(&exp, known_answers[j][2]);
+            bigint_from_decimal(&expected, known_answers[j][3]);
+            total++;
+            
+            int mont_ret = montgomery_exp(&mont_result, &base, &exp, &ctx);
+            if (mont_ret == 0 && bigint_compare(&mont_result, &expected) == 0) {
+                passed++;
+            } else {
+                printf("❌ Mismatch: %s^%s mod %s (montgomery ret %d)\n",
+                       known_answers[j][1], known_answers[j][2], moduli[i], mont_ret);
+            }
+        }
+        
+        montgomery_ctx_free(&ctx);
+    }
+    
+    printf("===============================================\n");
+    printf("  ✅ Montgomery checks passed: %d/%d\n", passed, total);
+    printf("===============================================\n");
+    
+    return (passed == total) ? 0 : -1;
+}
+
 /* ENHANCED TEST IMPLEMENTATIONS */
 int test_large_rsa_keys(void) { 
     printf("===============================================\n");
@@ -258,6 +503,72 @@ int test_large_rsa_keys(void) {
         return -1;
     }
     
+    /* CRT decryption: p = 11, q = 13, d = 103 */
+    rsa_4096_crt_key_t crt_key;
+    ret = rsa_4096_load_crt_key(&crt_key, "11", "13", "103");
+    if (ret != 0) {
+        printf("❌ Failed to load CRT key: %d\n", ret);
+        rsa_4096_free(&pub_key);
+        rsa_4096_free(&priv_key);
+        return ret;
+    }
+    
+    char crt_msg[512];
+    ret = rsa_4096_decrypt_crt(&crt_key, encrypted_hex, crt_msg, sizeof(crt_msg));
+    rsa_4096_crt_free(&crt_key);
+    if (ret != 0) {
+        printf("❌ CRT decryption failed: %d\n", ret);
+        rsa_4096_free(&pub_key);
+        rsa_4096_free(&priv_key);
+        return ret;
+    }
+    
+    printf("   CRT decrypted: %s\n", crt_msg);
+    
+    if (strcmp(test_msg, crt_msg) == 0) {
+        printf("✅ CRT decryption test PASSED\n");
+    } else {
+        printf("❌ CRT decryption test FAILED\n");
+        rsa_4096_free(&pub_key);
+        rsa_4096_free(&priv_key);
+        return -1;
+    }
+    
+    /* Multi-word CRT decryption: 90-bit p (3 words), 110-bit q (4 words), e = 65537 */
+    const char *crt_p = "668135851108668482195146291";
+    const char *crt_q = "1116795903992095674280049951926909";
+    const char *crt_d = "501235163550589183058521039263125210862966450727635146178113";
+    const char *crt_expected = "698542436864689892396226499404065406152403909613836490486";
+    const char *crt_encrypted = "4fe389b7eccae8923ff0ac2e3cd325fe2fcb9017fe0dcf8d7b";
+    
+    ret = rsa_4096_load_crt_key(&crt_key, crt_p, crt_q, crt_d);
+    if (ret != 0) {
+        printf("❌ Failed to load multi-word CRT key: %d\n", ret);
+        rsa_4096_free(&pub_key);
+        rsa_4096_free(&priv_key);
+        return ret;
+    }
+    
+    ret = rsa_4096_decrypt_crt(&crt_key, crt_encrypted, crt_msg, sizeof(crt_msg));
+    rsa_4096_crt_free(&crt_key);
+    if (ret != 0) {
+        printf("❌ Multi-word CRT decryption failed: %d\n", ret);
+        rsa_4096_free(&pub_key);
+        rsa_4096_free(&priv_key);
+        return ret;
+    }
+    
+    printf("   Multi-word CRT decrypted: %s\n", crt_msg);
+    
+    if (strcmp(crt_expected, crt_msg) == 0) {
+        printf("✅ Multi-word CRT decryption test PASSED\n");
+    } else {
+        printf("❌ Multi-word CRT decryption test FAILED\n");
+        rsa_4096_free(&pub_key);
+        rsa_4096_free(&priv_key);
+        return -1;
+    }
+    
     printf("===============================================\n");
     rsa_4096_free(&pub_key);
     rsa_4096_free(&priv_key);